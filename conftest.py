@@ -0,0 +1,19 @@
+# conftest.py
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Install a FreeSimpleGUI stand-in before any test module imports the GUI.
+# MagicMock creates Window, Text, Input, ... on first access, so only the
+# attributes with meaningful values are spelled out.
+sys.modules.setdefault('FreeSimpleGUI', MagicMock(
+    TABLE_SELECT_MODE_BROWSE='browse',
+    popup_yes_no=MagicMock(return_value='Yes'),
+))
+
+
+@pytest.fixture(scope="session")
+def mock_sg():
+    """The FreeSimpleGUI mock installed in sys.modules"""
+    return sys.modules['FreeSimpleGUI']
@@ -1,20 +1,205 @@
 # database_manager.py
 import sqlite3
+import csv
 import os
+import operator
+import queue
+from contextlib import contextmanager
+from urllib.request import pathname2url
 from datetime import datetime
 from decimal import Decimal
 from enhanced_stamp import Stamp, StampCollection
 from typing import List, Tuple, Dict, Optional, Any
 
+_INSERT_STAMP_SQL = '''
+    INSERT INTO stamps (
+        scott_number, description, country, year, denomination,
+        color, condition_grade, gum_condition, perforation,
+        used, plate_block, first_day_cover, location, notes,
+        qty_mint, qty_used, catalog_value_mint, catalog_value_used,
+        purchase_price, current_market_value, want_list, for_sale,
+        date_acquired, source, image_path
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Fixed SQL for the per-stamp paths, so sqlite3's statement cache reuses
+# the compiled statement instead of preparing it again on every call
+_UPDATE_STAMP_SQL = '''
+    UPDATE stamps SET
+        scott_number=?, description=?, country=?, year=?, denomination=?,
+        color=?, condition_grade=?, gum_condition=?, perforation=?,
+        used=?, plate_block=?, first_day_cover=?, location=?, notes=?,
+        qty_mint=?, qty_used=?, catalog_value_mint=?, catalog_value_used=?,
+        purchase_price=?, current_market_value=?, want_list=?, for_sale=?,
+        date_acquired=?, source=?, image_path=?
+    WHERE id=?
+'''
+_SELECT_STAMP_SQL = 'SELECT * FROM stamps WHERE id=?'
+_DELETE_STAMP_SQL = 'DELETE FROM stamps WHERE id=?'
+
+# All statistics counts and the total value in one pass over the table
+_STATS_SQL = '''
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(used=1), 0),
+        COUNT(DISTINCT country),
+        COALESCE(SUM(want_list=1), 0),
+        COALESCE(SUM(for_sale=1), 0),
+        SUM(CASE 
+            WHEN used=1 THEN catalog_value_used * qty_used
+            ELSE catalog_value_mint * qty_mint
+        END)
+    FROM stamps
+'''
+
+
+# Column order shared by INSERT/UPDATE statements and _stamp_to_tuple
+_STAMP_FIELDS = (
+    'scott_number', 'description', 'country', 'year', 'denomination',
+    'color', 'condition_grade', 'gum_condition', 'perforation',
+    'used', 'plate_block', 'first_day_cover', 'location', 'notes',
+    'qty_mint', 'qty_used', 'catalog_value_mint', 'catalog_value_used',
+    'purchase_price', 'current_market_value', 'want_list', 'for_sale',
+    'date_acquired', 'source', 'image_path',
+)
+_STAMP_GETTER = operator.attrgetter(*_STAMP_FIELDS)
+# Positions of the Decimal money fields, stored as REAL
+_MONEY_SLICE = slice(16, 20)
+# IDs per DELETE ... IN (...); older SQLite builds allow at most 999 parameters
+_DELETE_BATCH = 900
+
+# Row conversion: SELECT * yields the id followed by _STAMP_FIELDS
+_ROW_COLUMNS = ('id',) + _STAMP_FIELDS
+_BOOL_FIELDS = ('used', 'plate_block', 'first_day_cover', 'want_list', 'for_sale')
+_MONEY_FIELDS = _STAMP_FIELDS[_MONEY_SLICE]
+
+# Coercions for typed columns; optional text columns keep None as-is
+_ROW_CONVERTERS = {
+    'scott_number': lambda v: str(v or ''),
+    'description': lambda v: str(v or ''),
+    'year': lambda v: int(v) if v else None,
+    'condition_grade': lambda v: str(v or 'Unknown'),
+    'gum_condition': lambda v: str(v or 'Unknown'),
+    'qty_mint': lambda v: int(v or 0),
+    'qty_used': lambda v: int(v or 0),
+}
+_ROW_CONVERTERS.update((name, bool) for name in _BOOL_FIELDS)
+_ROW_CONVERTERS.update((name, lambda v: Decimal(str(v or '0.00'))) for name in _MONEY_FIELDS)
+
+# CSV import: text -> field value for typed columns; other columns stay text
+_CSV_PARSERS = {'year': int, 'qty_mint': int, 'qty_used': int}
+_CSV_PARSERS.update((name, lambda text: text.strip().lower() in ('1', 'true', 'yes'))
+                    for name in _BOOL_FIELDS)
+_CSV_PARSERS.update((name, Decimal) for name in _MONEY_FIELDS)
+# Stamp fields without a default; an imported row must fill them
+_CSV_REQUIRED = ('scott_number', 'description')
+# Rows fetched per round trip when exporting
+_EXPORT_BATCH = 1000
+
+# Columns needed to list, filter and value stamps without their notes/images
+LIST_COLUMNS = (
+    'id', 'scott_number', 'description', 'country', 'year', 'condition_grade',
+    'used', 'want_list', 'qty_mint', 'qty_used', 'catalog_value_mint', 'catalog_value_used',
+)
+
+# search_stamps criteria: key -> (SQL condition, parameter builder or None)
+_SEARCH_CLAUSES = (
+    ('description', 'description LIKE ?', lambda v: f"%{v}%"),
+    ('scott_number', 'scott_number LIKE ?', lambda v: f"%{v}%"),
+    ('country', 'country LIKE ?', lambda v: f"%{v}%"),
+    ('year_from', 'year >= ?', int),
+    ('year_to', 'year <= ?', int),
+    ('used_only', 'used = 1', None),
+    ('want_list', 'want_list = 1', None),
+)
+
+
 class DatabaseManager:
-    def __init__(self, db_path: str = "stamps.db"):
+    # Size of each connection's prepared-statement cache (sqlite3 defaults to 128)
+    CACHED_STATEMENTS = 256
+
+    # Applied to every connection; WAL with synchronous=NORMAL avoids an fsync per commit
+    DEFAULT_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -64000,       # negative = KiB, i.e. ~64 MB
+        'mmap_size': 268435456,     # 256 MB
+        'busy_timeout': 5000,       # ms to wait on a locked database before failing
+    }
+    
+    def __init__(self, db_path: str = "stamps.db", pragmas: Optional[Dict[str, Any]] = None,
+                 check_same_thread: bool = True, readers: int = 0):
         self.db_path = db_path
+        # Search SQL keyed by which criteria are set and which columns are read;
+        # sqlite3's own statement cache then reuses the prepared statement for each
+        self._search_sql: Dict[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]], str] = {}
+        # One long-lived connection; this also keeps ":memory:" databases alive
+        # Pass check_same_thread=False to share the connection with a worker thread
+        self.conn = sqlite3.connect(db_path, check_same_thread=check_same_thread,
+                                    cached_statements=self.CACHED_STATEMENTS)
+        pragmas = self.DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self._apply_pragmas(self.conn, pragmas)
         self._create_tables()
+        # Optional read-only connections for queries, so reads don't queue behind
+        # writes on the main connection; None means reads use self.conn
+        self._readers: Optional[queue.Queue] = None
+        # Every reader opened, including ones borrowed at close() time
+        self._reader_conns: List[sqlite3.Connection] = []
+        if readers and db_path != ":memory:":
+            self._open_readers(readers, pragmas)
+    
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection, pragmas: Dict[str, Any]):
+        """Configure a connection with the given PRAGMA settings"""
+        for name, value in pragmas.items():
+            conn.execute(f'PRAGMA {name}={value}')
+    
+    def _open_readers(self, count: int, pragmas: Dict[str, Any]):
+        """Open count read-only connections to the database file"""
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        # The journal mode is a property of the file, set by the main connection
+        reader_pragmas = {name: value for name, value in pragmas.items() if name != 'journal_mode'}
+        self._readers = queue.Queue()
+        for _ in range(count):
+            # Readers are handed between threads, one user at a time
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=self.CACHED_STATEMENTS)
+            self._apply_pragmas(conn, reader_pragmas)
+            self._reader_conns.append(conn)
+            self._readers.put(conn)
+    
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection, or the main connection if none is free"""
+        if self._readers is None:
+            yield self.conn
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            # Never block the caller (possibly the GUI thread) waiting for a reader
+            yield self.conn
+            return
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close the database connection and any reader connections"""
+        for conn in self._reader_conns:
+            conn.close()
+        self._reader_conns = []
+        self.conn.close()
+    
+    def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a raw SQL statement on the manager's connection"""
+        return self.conn.execute(sql, params)
     
     def _create_tables(self):
         """Create database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS stamps (
@@ -47,126 +232,198 @@ class DatabaseManager:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Indexes for exact-match lookups and filtered searches
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_search ON stamps(country, year, used, want_list)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scott ON stamps(scott_number)')
+        
+        self.conn.commit()
     
     def load_collection(self) -> StampCollection:
         """Load all stamps from database"""
         collection = StampCollection()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM stamps')
-        rows = cursor.fetchall()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute('SELECT * FROM stamps').fetchall()
+        collection._bulk_load([self._create_stamp_from_row(row) for row in rows])
         
-        for row in rows:
-            stamp = self._create_stamp_from_row(row)
-            collection.add_stamp(stamp)
-        
-        conn.close()
         return collection
     
     def add_stamp(self, stamp: Stamp) -> int:
         """Add a stamp to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO stamps (
-                scott_number, description, country, year, denomination,
-                color, condition_grade, gum_condition, perforation,
-                used, plate_block, first_day_cover, location, notes,
-                qty_mint, qty_used, catalog_value_mint, catalog_value_used,
-                purchase_price, current_market_value, want_list, for_sale,
-                date_acquired, source, image_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', self._stamp_to_tuple(stamp))
+        cursor.execute(_INSERT_STAMP_SQL, self._stamp_to_tuple(stamp))
         
         stamp_id = cursor.lastrowid
         if stamp_id is None:
             raise ValueError("Failed to get ID of inserted stamp")
             
-        conn.commit()
-        conn.close()
+        self.conn.commit()
         return stamp_id
     
+    def add_stamps_bulk(self, stamps: List[Stamp]) -> List[int]:
+        """Add several stamps in a single transaction, returning their IDs in order"""
+        rows = [self._stamp_to_tuple(stamp) for stamp in stamps]
+        if not rows:
+            return []
+        
+        conn = self.conn
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(_INSERT_STAMP_SQL, rows)
+            # The write lock is held, so the new IDs are contiguous
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+    
+    def export_csv(self, path: str) -> int:
+        """Write every stamp to a CSV file with a header row; returns the number written"""
+        count = 0
+        with self._reader() as conn, open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(_STAMP_FIELDS)
+            cursor = conn.execute(f"SELECT {', '.join(_STAMP_FIELDS)} FROM stamps ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(_EXPORT_BATCH)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                count += len(rows)
+        return count
+    
+    def import_csv(self, path: str, batch: int = 500) -> int:
+        """Add the stamps in a CSV file (as written by export_csv) in one transaction
+        
+        Columns are matched by header name; unknown columns, including 'id',
+        are ignored. scott_number and description are required; other empty
+        cells take the Stamp defaults. A missing required value or an
+        unparsable cell raises ValueError naming the row (the header is row 1)
+        and nothing is added. Returns the number of stamps added.
+        """
+        conn = self.conn
+        count = 0
+        rows = []
+        with open(path, newline='', encoding='utf-8') as f:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                for row_number, record in enumerate(csv.DictReader(f), start=2):
+                    values = self._csv_record_to_values(record, row_number)
+                    rows.append(self._stamp_to_tuple(Stamp(**values)))
+                    if len(rows) >= batch:
+                        conn.executemany(_INSERT_STAMP_SQL, rows)
+                        count += len(rows)
+                        rows.clear()
+                if rows:
+                    conn.executemany(_INSERT_STAMP_SQL, rows)
+                    count += len(rows)
+                conn.commit()
+            except Exception:
+                # Bad data or a failed insert leaves the database untouched
+                conn.rollback()
+                raise
+        return count
+    
     def update_stamp(self, stamp_id: int, stamp: Stamp):
         """Update existing stamp"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         values = self._stamp_to_tuple(stamp) + (stamp_id,)
-        cursor.execute('''
-            UPDATE stamps SET
-                scott_number=?, description=?, country=?, year=?, denomination=?,
-                color=?, condition_grade=?, gum_condition=?, perforation=?,
-                used=?, plate_block=?, first_day_cover=?, location=?, notes=?,
-                qty_mint=?, qty_used=?, catalog_value_mint=?, catalog_value_used=?,
-                purchase_price=?, current_market_value=?, want_list=?, for_sale=?,
-                date_acquired=?, source=?, image_path=?
-            WHERE id=?
-        ''', values)
+        cursor.execute(_UPDATE_STAMP_SQL, values)
         
-        conn.commit()
-        conn.close()
+        self.conn.commit()
     
     def delete_stamp(self, stamp_id: int):
         """Delete stamp from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
-        cursor.execute('DELETE FROM stamps WHERE id=?', (stamp_id,))
-        conn.commit()
-        conn.close()
+        cursor.execute(_DELETE_STAMP_SQL, (stamp_id,))
+        self.conn.commit()
     
-    def search_stamps(self, criteria: Dict) -> List[Tuple[int, Stamp]]:
-        """Search stamps based on criteria"""
-        conditions = []
-        params = []
+    def delete_stamps(self, stamp_ids: List[int]):
+        """Delete several stamps in a single transaction"""
+        stamp_ids = list(stamp_ids)
+        if not stamp_ids:
+            return
         
-        if criteria['description']:
-            conditions.append('description LIKE ?')
-            params.append(f"%{criteria['description']}%")
-        if criteria['scott_number']:
-            conditions.append('scott_number LIKE ?')
-            params.append(f"%{criteria['scott_number']}%")
-        if criteria['country']:
-            conditions.append('country LIKE ?')
-            params.append(f"%{criteria['country']}%")
-        if criteria['year_from']:
-            conditions.append('year >= ?')
-            params.append(int(criteria['year_from']))
-        if criteria['year_to']:
-            conditions.append('year <= ?')
-            params.append(int(criteria['year_to']))
-        if criteria['used_only']:
-            conditions.append('used = 1')
-        if criteria['want_list']:
-            conditions.append('want_list = 1')
+        conn = self.conn
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for start in range(0, len(stamp_ids), _DELETE_BATCH):
+                batch = stamp_ids[start:start + _DELETE_BATCH]
+                conn.execute(f'DELETE FROM stamps WHERE id IN ({",".join("?" * len(batch))})', batch)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    
+    def get_stamp(self, stamp_id: int) -> Optional[Stamp]:
+        """Return the stamp with the given ID, or None"""
+        # SELECT * yields _ROW_COLUMNS in order, so a plain tuple row will do
+        with self._reader() as conn:
+            row = conn.execute(_SELECT_STAMP_SQL, (stamp_id,)).fetchone()
+        return self._create_stamp_from_row(row) if row is not None else None
+    
+    def list_all_stamps(self, columns: Optional[Tuple[str, ...]] = None) -> List[Tuple[int, Stamp]]:
+        """Return every stamp with its ID, in ID order
         
-        query = 'SELECT * FROM stamps'
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
+        columns limits which fields are read (e.g. LIST_COLUMNS); the rest keep
+        their Stamp defaults. 'id', 'scott_number' and 'description' are required.
+        """
+        select = ', '.join(columns) if columns else '*'
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute(f'SELECT {select} FROM stamps ORDER BY id').fetchall()
+        return [(row['id'], self._create_stamp_from_row(row)) for row in rows]
+    
+    def search_stamps(self, criteria: Dict,
+                      columns: Optional[Tuple[str, ...]] = None) -> List[Tuple[int, Stamp]]:
+        """Search stamps based on criteria; columns works as in list_all_stamps"""
+        active = []
+        params = []
+        for key, _, to_param in _SEARCH_CLAUSES:
+            value = criteria[key]
+            if value:
+                active.append(key)
+                if to_param is not None:
+                    params.append(to_param(value))
+        
+        cache_key = (tuple(active), columns)
+        query = self._search_sql.get(cache_key)
+        if query is None:
+            query = self._build_search_sql(*cache_key)
+            self._search_sql[cache_key] = query
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
         
         results = []
         for row in rows:
-            stamp_id = row[0]
+            stamp_id = row['id']
             stamp = self._create_stamp_from_row(row)
             results.append((stamp_id, stamp))
         
-        conn.close()
         return results
     
+    @staticmethod
+    def _build_search_sql(keys: Tuple[str, ...], columns: Optional[Tuple[str, ...]] = None) -> str:
+        """Build the search SELECT for the given set of active criteria"""
+        conditions = [condition for key, condition, _ in _SEARCH_CLAUSES if key in keys]
+        query = f"SELECT {', '.join(columns) if columns else '*'} FROM stamps"
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        return query
+    
     def get_statistics(self) -> Dict:
         """Get collection statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         stats = {
             'total_stamps': 0,
             'used_stamps': 0,
@@ -178,88 +435,65 @@ class DatabaseManager:
             'for_sale_items': 0
         }
         
-        # Get basic counts
-        cursor.execute('SELECT COUNT(*) FROM stamps')
-        stats['total_stamps'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM stamps WHERE used=1')
-        stats['used_stamps'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(DISTINCT country) FROM stamps')
-        stats['countries'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM stamps WHERE want_list=1')
-        stats['want_list_items'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM stamps WHERE for_sale=1')
-        stats['for_sale_items'] = cursor.fetchone()[0]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_STATS_SQL)
+            (stats['total_stamps'], stats['used_stamps'], stats['countries'],
+             stats['want_list_items'], stats['for_sale_items'], total_value) = cursor.fetchone()
         
         # Calculate mint stamps
         stats['mint_stamps'] = stats['total_stamps'] - stats['used_stamps']
-        
-        # Calculate total value - fixed calculation
-        cursor.execute('''
-            SELECT 
-                SUM(CASE 
-                    WHEN used=1 THEN catalog_value_used * qty_used
-                    ELSE catalog_value_mint * qty_mint
-                END)
-            FROM stamps
-        ''')
-        total_value = cursor.fetchone()[0] or 0
-        stats['total_catalog_value'] = Decimal(str(total_value))
+        stats['total_catalog_value'] = Decimal(str(total_value or 0))
         
         # Calculate average value
         if stats['total_stamps'] > 0:
             stats['average_value'] = stats['total_catalog_value'] / stats['total_stamps']
         
-        conn.close()
         return stats
 
+    @staticmethod
+    def _csv_record_to_values(record: Dict[str, str], row_number: int) -> Dict[str, Any]:
+        """Parse one CSV record into Stamp keyword arguments, skipping empty cells"""
+        values = {}
+        for name in _STAMP_FIELDS:
+            text = record.get(name)
+            if not text:
+                continue
+            parse = _CSV_PARSERS.get(name)
+            try:
+                values[name] = parse(text) if parse is not None else text
+            except (ValueError, ArithmeticError) as e:
+                # Decimal reports bad text as InvalidOperation, an ArithmeticError
+                raise ValueError(f"row {row_number}: invalid {name} {text!r}") from e
+        for name in _CSV_REQUIRED:
+            if name not in values:
+                raise ValueError(f"row {row_number}: {name} is required")
+        return values
+    
     def _stamp_to_tuple(self, stamp: Stamp) -> tuple:
         """Convert Stamp object to tuple for database operations"""
+        values = _STAMP_GETTER(stamp)
         return (
-            stamp.scott_number, stamp.description, stamp.country, stamp.year,
-            stamp.denomination, stamp.color, stamp.condition_grade,
-            stamp.gum_condition, stamp.perforation, stamp.used,
-            stamp.plate_block, stamp.first_day_cover, stamp.location,
-            stamp.notes, stamp.qty_mint, stamp.qty_used,
-            float(stamp.catalog_value_mint), float(stamp.catalog_value_used),
-            float(stamp.purchase_price), float(stamp.current_market_value),
-            stamp.want_list, stamp.for_sale, stamp.date_acquired,
-            stamp.source, stamp.image_path
+            values[:_MONEY_SLICE.start]
+            + tuple(map(float, values[_MONEY_SLICE]))
+            + values[_MONEY_SLICE.stop:]
         )
     
-    def _create_stamp_from_row(self, row: tuple) -> Stamp:
-        """Create Stamp object from database row"""
+    def _create_stamp_from_row(self, row) -> Stamp:
+        """Create Stamp object from a database row (sqlite3.Row or plain tuple)"""
         try:
-            return Stamp(
-                scott_number=str(row[1] or ''),
-                description=str(row[2] or ''),
-                country=row[3] if row[3] is not None else None,  # Fixed: don't convert None to string
-                year=int(row[4]) if row[4] else None,
-                denomination=row[5] if row[5] is not None else None,  # Fixed: don't convert None to string
-                color=row[6] if row[6] is not None else None,  # Fixed: don't convert None to string
-                condition_grade=str(row[7] or 'Unknown'),
-                gum_condition=str(row[8] or 'Unknown'),
-                perforation=row[9] if row[9] is not None else None,  # Fixed: don't convert None to string
-                used=bool(row[10]),
-                plate_block=bool(row[11]),
-                first_day_cover=bool(row[12]),
-                location=row[13] if row[13] is not None else None,  # Fixed: don't convert None to string
-                notes=row[14] if row[14] is not None else None,  # Fixed: don't convert None to string
-                qty_mint=int(row[15] or 0),
-                qty_used=int(row[16] or 0),
-                catalog_value_mint=Decimal(str(row[17] or '0.00')),
-                catalog_value_used=Decimal(str(row[18] or '0.00')),
-                purchase_price=Decimal(str(row[19] or '0.00')),
-                current_market_value=Decimal(str(row[20] or '0.00')),
-                want_list=bool(row[21]),
-                for_sale=bool(row[22]),
-                date_acquired=row[23] if row[23] is not None else None,  # Fixed: don't convert None to string
-                source=row[24] if row[24] is not None else None,  # Fixed: don't convert None to string
-                image_path=row[25] if row[25] is not None else None  # Fixed: don't convert None to string
-            )
+            if isinstance(row, sqlite3.Row):
+                values = dict(row)
+            else:
+                values = dict(zip(_ROW_COLUMNS, row))
+            del values['id']
+            
+            for name, value in values.items():
+                convert = _ROW_CONVERTERS.get(name)
+                if convert is not None:
+                    values[name] = convert(value)
+            
+            return Stamp(**values)
         except Exception as e:
             print(f"Error creating stamp from row: {e}")
-            raise
\ No newline at end of file
+            raise
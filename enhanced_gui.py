@@ -617,6 +617,7 @@ For Sale Items: {stats['for_sale_items']}
                 sg.popup_error(f"An error occurred: {e}")
         
         self.window.close()
+        self.db_manager.close()
 
     def _handle_table_double_click(self, row):
         """Handle double-click on stamp table"""
@@ -1,9 +1,15 @@
 # enhanced_stamp.py
+import sys
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Dict
 
-@dataclass
+_ZERO = Decimal('0.00')
+
+# Slots make field access cheaper and stamps smaller; dataclass supports them from 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Stamp:
     scott_number: str
     description: str
@@ -34,19 +40,48 @@ class Stamp:
     def calculate_total_value(self) -> Decimal:
         """Calculate total value based on condition"""
         if self.used:
-            qty = self.qty_used if self.qty_used is not None else 0
-            return self.catalog_value_used * qty
-        qty = self.qty_mint if self.qty_mint is not None else 0
-        return self.catalog_value_mint * qty
+            qty, value = self.qty_used, self.catalog_value_used
+        else:
+            qty, value = self.qty_mint, self.catalog_value_mint
+        # Skip the Decimal multiply for the common zero/None quantity case
+        if not qty:
+            return _ZERO
+        return value * qty
 
 class StampCollection:
     def __init__(self):
-        self.stamps: List[Stamp] = []
+        self._stamps: List[Stamp] = []
+        # Scott numbers need not be unique, so each maps to its stamps in insertion order
+        self._by_scott: Dict[str, List[Stamp]] = {}
+
+    @property
+    def stamps(self) -> List[Stamp]:
+        """All stamps in insertion order"""
+        return self._stamps
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    def __contains__(self, stamp: Stamp) -> bool:
+        return stamp in self._by_scott.get(stamp.scott_number, ())
 
     def add_stamp(self, stamp: Stamp):
         """Add a stamp to the collection"""
-        self.stamps.append(stamp)
+        self._stamps.append(stamp)
+        self._by_scott.setdefault(stamp.scott_number, []).append(stamp)
+
+    def _bulk_load(self, stamps: List[Stamp]):
+        """Append many stamps at once, indexing them in one pass"""
+        self._stamps.extend(stamps)
+        by_scott = self._by_scott
+        for stamp in stamps:
+            by_scott.setdefault(stamp.scott_number, []).append(stamp)
+
+    def lookup(self, scott_number: str) -> Optional[Stamp]:
+        """Return the first stamp with the given Scott number, or None"""
+        matches = self._by_scott.get(scott_number)
+        return matches[0] if matches else None
 
     def list_stamps(self) -> List[Stamp]:
         """Return list of all stamps"""
-        return self.stamps
\ No newline at end of file
+        return self._stamps
\ No newline at end of file
@@ -8,8 +8,8 @@ import unittest
 import sys
 import os
 import argparse
+import fnmatch
 from io import StringIO
-import tempfile
 from typing import Optional
 
 # Add the project root to the Python path
@@ -52,10 +52,13 @@ class TestResult:
         self.skipped.append((test, reason))
 
 
+# One loader for every suite this runner builds
+_LOADER = unittest.TestLoader()
+
+
 def discover_tests(test_directory='.', pattern='test_*.py'):
     """Discover all test files in the given directory"""
-    loader = unittest.TestLoader()
-    suite = loader.discover(test_directory, pattern=pattern)
+    suite = _LOADER.discover(test_directory, pattern=pattern)
     return suite
 
 
@@ -63,14 +66,34 @@ def run_specific_test_module(module_name):
     """Run tests from a specific module"""
     try:
         module = __import__(module_name)
-        loader = unittest.TestLoader()
-        suite = loader.loadTestsFromModule(module)
+        suite = _LOADER.loadTestsFromModule(module)
         return suite
     except ImportError as e:
         print(f"Error importing test module {module_name}: {e}")
         return None
 
 
+def make_runner(verbosity=None, stream=None):
+    """Build a TextTestRunner; verbosity defaults to $TEST_VERBOSITY, else 2 (per-test lines)"""
+    if verbosity is None:
+        verbosity = int(os.environ.get('TEST_VERBOSITY', '2'))
+    if stream is None:
+        stream = StringIO() if verbosity == 0 else sys.stderr
+    # buffer=True only prints a test's stdout/stderr when it fails
+    return unittest.TextTestRunner(verbosity=verbosity, stream=stream, buffer=True)
+
+
+def run_pytest_tests(paths, quiet=False):
+    """Run pytest-style test modules and return pytest's exit code"""
+    try:
+        import pytest
+    except ImportError:
+        print("pytest is required to run the GUI tests: pip install pytest")
+        return 1
+    
+    return int(pytest.main(list(paths) + (['-q'] if quiet else ['-v'])))
+
+
 def print_test_summary(result):
     """Print a detailed test summary"""
     total_tests = result.testsRun
@@ -115,7 +138,7 @@ def run_tests_with_coverage(test_suite, coverage_report=True):
     """Run tests with coverage measurement"""
     if not HAS_COVERAGE or coverage_module is None:
         print("Coverage measurement not available. Running tests without coverage.")
-        runner = unittest.TextTestRunner(verbosity=2)
+        runner = make_runner()
         return runner.run(test_suite)
     
     # Initialize coverage
@@ -124,7 +147,7 @@ def run_tests_with_coverage(test_suite, coverage_report=True):
     
     try:
         # Run tests
-        runner = unittest.TextTestRunner(verbosity=2, stream=StringIO())
+        runner = make_runner(stream=StringIO())
         result = runner.run(test_suite)
         
         # Stop coverage measurement
@@ -150,7 +173,7 @@ def run_tests_with_coverage(test_suite, coverage_report=True):
         cov.stop()
         print(f"Error during coverage measurement: {e}")
         # Fall back to running without coverage
-        runner = unittest.TextTestRunner(verbosity=2)
+        runner = make_runner()
         return runner.run(test_suite)
 
 
@@ -158,34 +181,13 @@ def run_integration_tests():
     """Run integration tests that require database setup"""
     print("Running integration tests...")
     
-    # Create temporary database for integration tests
-    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-    temp_db.close()
+    # The integration tests create their own databases, so no shared one is needed
+    from test_stamp_collection import TestDatabaseIntegration
     
-    try:
-        # Set environment variable for test database
-        os.environ['TEST_DB_PATH'] = temp_db.name
-        
-        # Import and run integration tests
-        from test_stamp_collection import TestDatabaseIntegration
-        
-        loader = unittest.TestLoader()
-        suite = loader.loadTestsFromTestCase(TestDatabaseIntegration)
-        
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        return result
-        
-    finally:
-        # Clean up
-        try:
-            os.unlink(temp_db.name)
-        except OSError:
-            pass
-        
-        if 'TEST_DB_PATH' in os.environ:
-            del os.environ['TEST_DB_PATH']
+    suite = _LOADER.loadTestsFromTestCase(TestDatabaseIntegration)
+    
+    runner = make_runner()
+    return runner.run(suite)
 
 
 def validate_test_environment():
@@ -285,19 +287,17 @@ def main():
         print("Running unit tests only...")
         test_suite = discover_tests(args.directory, 'test_stamp_collection.py')
     elif args.gui:
+        # test_gui.py is written with pytest fixtures, so hand it to pytest
         print("Running GUI tests only...")
-        try:
-            test_suite = discover_tests(args.directory, 'test_gui.py')
-        except Exception as e:
-            print(f"GUI tests not available: {e}")
-            sys.exit(1)
+        sys.exit(run_pytest_tests([os.path.join(args.directory, 'test_gui.py')], args.quiet))
     else:
         print("Running all available tests...")
         test_suite = discover_tests(args.directory, args.pattern)
     
     # Run tests
     if args.no_coverage or not HAS_COVERAGE:
-        runner = unittest.TextTestRunner(verbosity=2 if not args.quiet else 1)
+        # --quiet drops to one dot per test
+        runner = make_runner(verbosity=1 if args.quiet else None)
         result = runner.run(test_suite)
     else:
         result = run_tests_with_coverage(test_suite, coverage_report=not args.quiet)
@@ -306,8 +306,14 @@ def main():
     if not args.quiet:
         print_test_summary(result)
     
+    # The GUI tests are pytest-style and invisible to unittest discovery
+    gui_passed = True
+    if not (args.module or args.unit) and fnmatch.fnmatch('test_gui.py', args.pattern):
+        print("\nRunning GUI tests with pytest...")
+        gui_passed = run_pytest_tests([os.path.join(args.directory, 'test_gui.py')], args.quiet) == 0
+    
     # Check if tests passed
-    if result.wasSuccessful():
+    if result.wasSuccessful() and gui_passed:
         print("\n🎉 All tests passed!")
         sys.exit(0)
     else:
@@ -342,7 +348,10 @@ sys.path.insert(0, project_root)
 @pytest.fixture(scope="session")
 def test_database():
     """Create a temporary test database for the session"""
-    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+    # Prefer a RAM-backed directory so the session database avoids disk fsyncs
+    temp_dir = os.environ.get('STAMP_TEST_TMPDIR') or (
+        '/dev/shm' if os.path.isdir('/dev/shm') else None)
+    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db', dir=temp_dir)
     temp_db.close()
     
     yield temp_db.name
@@ -1,6 +1,6 @@
 # test_stamp_collection.py
 import unittest
-import sqlite3
+import copy
 import tempfile
 import os
 from decimal import Decimal
@@ -9,20 +9,26 @@ from unittest.mock import patch, MagicMock
 
 # Import the modules to test
 from enhanced_stamp import Stamp, StampCollection
-from database_manager import DatabaseManager
+
+# File-backed tests write here; tmpfs keeps them off the disk where available
+_TEST_TMPDIR = os.environ.get('STAMP_TEST_TMPDIR') or (
+    '/dev/shm' if os.path.isdir('/dev/shm') else None)
 
 
 class TestStamp(unittest.TestCase):
     """Test cases for the Stamp class"""
     
-    def setUp(self):
-        """Set up test fixtures before each test method"""
-        self.basic_stamp = Stamp(
-            scott_number="US001",
-            description="Test Stamp"
-        )
-        
-        self.detailed_stamp = Stamp(
+    # Money values reused across tests, parsed once
+    _ZERO = Decimal('0.00')
+    _D_5_50 = Decimal('5.50')
+    _D_10 = Decimal('10.00')
+    _D_11 = Decimal('11.00')
+    _D_30 = Decimal('30.00')
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the detailed stamp once; tests work on a copy of it"""
+        cls._detailed_template = Stamp(
             scott_number="US002",
             description="Detailed Test Stamp",
             country="USA",
@@ -50,6 +56,16 @@ class TestStamp(unittest.TestCase):
             image_path="/images/stamp002.jpg"
         )
     
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.basic_stamp = Stamp(
+            scott_number="US001",
+            description="Test Stamp"
+        )
+        
+        # Field values are immutable, so a shallow copy isolates each test
+        self.detailed_stamp = copy.copy(self._detailed_template)
+    
     def test_stamp_creation_minimal(self):
         """Test creating a stamp with minimal required fields"""
         self.assertEqual(self.basic_stamp.scott_number, "US001")
@@ -57,7 +73,7 @@ class TestStamp(unittest.TestCase):
         self.assertIsNone(self.basic_stamp.country)
         self.assertEqual(self.basic_stamp.condition_grade, "Unknown")
         self.assertEqual(self.basic_stamp.qty_mint, 0)
-        self.assertEqual(self.basic_stamp.catalog_value_mint, Decimal('0.00'))
+        self.assertEqual(self.basic_stamp.catalog_value_mint, self._ZERO)
         self.assertFalse(self.basic_stamp.used)
     
     def test_stamp_creation_detailed(self):
@@ -74,18 +90,18 @@ class TestStamp(unittest.TestCase):
         """Test total value calculation for mint stamps"""
         self.detailed_stamp.used = False
         self.detailed_stamp.qty_mint = 3
-        self.detailed_stamp.catalog_value_mint = Decimal('10.00')
+        self.detailed_stamp.catalog_value_mint = self._D_10
         
-        expected_value = Decimal('30.00')
+        expected_value = self._D_30
         self.assertEqual(self.detailed_stamp.calculate_total_value(), expected_value)
     
     def test_calculate_total_value_used(self):
         """Test total value calculation for used stamps"""
         self.detailed_stamp.used = True
         self.detailed_stamp.qty_used = 2
-        self.detailed_stamp.catalog_value_used = Decimal('5.50')
+        self.detailed_stamp.catalog_value_used = self._D_5_50
         
-        expected_value = Decimal('11.00')
+        expected_value = self._D_11
         self.assertEqual(self.detailed_stamp.calculate_total_value(), expected_value)
     
     def test_calculate_total_value_zero_quantity(self):
@@ -93,7 +109,7 @@ class TestStamp(unittest.TestCase):
         self.detailed_stamp.qty_mint = 0
         self.detailed_stamp.qty_used = 0
         
-        self.assertEqual(self.detailed_stamp.calculate_total_value(), Decimal('0.00'))
+        self.assertEqual(self.detailed_stamp.calculate_total_value(), self._ZERO)
     
     def test_calculate_total_value_none_quantity(self):
         """Test total value calculation with None quantities"""
@@ -105,7 +121,7 @@ class TestStamp(unittest.TestCase):
         )
         
         # Should handle None values gracefully
-        self.assertEqual(stamp.calculate_total_value(), Decimal('0.00'))
+        self.assertEqual(stamp.calculate_total_value(), self._ZERO)
 
 
 class TestStampCollection(unittest.TestCase):
@@ -146,21 +162,53 @@ class TestStampCollection(unittest.TestCase):
         stamp_list = self.collection.list_stamps()
         self.assertEqual(len(stamp_list), 2)
         self.assertEqual(stamp_list, [self.stamp1, self.stamp2])
+    
+    def test_contains_and_lookup(self):
+        """Test membership and Scott number lookup"""
+        self.collection.add_stamp(self.stamp1)
+        
+        self.assertIn(self.stamp1, self.collection)
+        self.assertNotIn(self.stamp2, self.collection)
+        self.assertNotIn(Stamp(scott_number="US001", description="Other"), self.collection)
+        self.assertIs(self.collection.lookup("US001"), self.stamp1)
+        self.assertIsNone(self.collection.lookup("US002"))
+
+
+class _SharedDatabaseTestCase(unittest.TestCase):
+    """Base for database tests: one in-memory database per class, emptied after each test"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the database shared by every test in the class"""
+        # Imported here so runs of the Stamp-only classes never load the database layer
+        from database_manager import DatabaseManager
+        cls.DatabaseManager = DatabaseManager
+        cls.db_manager = DatabaseManager(":memory:")
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared database"""
+        cls.db_manager.close()
+    
+    def tearDown(self):
+        """Empty the stamps table and restart its IDs for the next test"""
+        self.db_manager.execute("DELETE FROM stamps")
+        self.db_manager.execute("DELETE FROM sqlite_sequence WHERE name='stamps'")
+        self.db_manager.conn.commit()
+    
+    def _temp_dir(self):
+        """Temporary directory removed after the test, once databases opened later are closed"""
+        # Cleanups run last-in first-out, so a database registered after this closes first
+        temp_dir = tempfile.TemporaryDirectory(dir=_TEST_TMPDIR)
+        self.addCleanup(temp_dir.cleanup)
+        return temp_dir.name
 
 
-class TestDatabaseManager(unittest.TestCase):
+class TestDatabaseManager(_SharedDatabaseTestCase):
     """Test cases for the DatabaseManager class"""
     
     def setUp(self):
-        """Set up test fixtures with temporary database"""
-        # Create temporary database file
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        
-        # Initialize database manager with temp database
-        self.db_manager = DatabaseManager(self.db_path)
-        
+        """Set up test stamps"""
         # Create test stamps
         self.test_stamp1 = Stamp(
             scott_number="TEST001",
@@ -182,27 +230,87 @@ class TestDatabaseManager(unittest.TestCase):
             want_list=True
         )
     
-    def tearDown(self):
-        """Clean up after tests"""
-        try:
-            os.unlink(self.db_path)
-        except OSError:
-            pass
-    
     def test_database_creation(self):
         """Test that database and tables are created properly"""
-        self.assertTrue(os.path.exists(self.db_path))
-        
         # Check that stamps table exists
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='stamps'")
-        result = cursor.fetchone()
-        conn.close()
+        result = self.db_manager.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='stamps'").fetchone()
         
         self.assertIsNotNone(result)
         self.assertEqual(result[0], "stamps")
     
+    def test_in_memory_database_persists_across_calls(self):
+        """Test that an in-memory database keeps its data between operations"""
+        memory_db = self.DatabaseManager(":memory:")
+        self.addCleanup(memory_db.close)
+        stamp_id = memory_db.add_stamp(self.test_stamp1)
+        
+        collection = memory_db.load_collection()
+        self.assertEqual(len(collection.stamps), 1)
+        self.assertEqual(collection.stamps[0].scott_number, "TEST001")
+        self.assertGreater(stamp_id, 0)
+        self.assertEqual(memory_db.get_statistics()['total_stamps'], 1)
+    
+    def test_default_pragmas_on_file_database(self):
+        """Test that a file-backed database is opened in WAL mode"""
+        file_db = self.DatabaseManager(os.path.join(self._temp_dir(), "pragmas.db"))
+        self.addCleanup(file_db.close)
+        cursor = file_db.conn.cursor()
+        
+        self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+        self.assertEqual(cursor.execute("PRAGMA temp_store").fetchone()[0], 2)  # MEMORY
+        self.assertEqual(cursor.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+    
+    def test_connection_shared_with_worker_thread(self):
+        """Test that check_same_thread=False allows queries from another thread"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        shared_db = self.DatabaseManager(":memory:", check_same_thread=False)
+        self.addCleanup(shared_db.close)
+        shared_db.add_stamp(self.test_stamp1)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stats = executor.submit(shared_db.get_statistics).result()
+        
+        self.assertEqual(stats['total_stamps'], 1)
+    
+    def test_reader_connections(self):
+        """Test that pooled reader connections are read-only and see committed writes"""
+        import sqlite3
+        
+        pooled_db = self.DatabaseManager(os.path.join(self._temp_dir(), "readers.db"), readers=2)
+        self.addCleanup(pooled_db.close)
+        stamp_id = pooled_db.add_stamp(self.test_stamp1)
+        
+        self.assertEqual(pooled_db.get_stamp(stamp_id).scott_number, "TEST001")
+        self.assertEqual(pooled_db.get_statistics()['total_stamps'], 1)
+        with pooled_db._reader() as conn:
+            self.assertIsNot(conn, pooled_db.conn)
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM stamps")
+    
+    def test_reader_pool_exhausted(self):
+        """Test that a busy reader pool falls back to the main connection and closes cleanly"""
+        import sqlite3
+        
+        pooled_db = self.DatabaseManager(os.path.join(self._temp_dir(), "readers.db"), readers=1)
+        with pooled_db._reader() as borrowed:
+            with pooled_db._reader() as conn:
+                self.assertIs(conn, pooled_db.conn)
+            pooled_db.close()
+        
+        with self.assertRaises(sqlite3.ProgrammingError):
+            borrowed.execute("SELECT 1")
+    
+    def test_custom_pragmas(self):
+        """Test that explicit pragmas replace the defaults"""
+        custom_db = self.DatabaseManager(":memory:", pragmas={'cache_size': -2000})
+        self.addCleanup(custom_db.close)
+        cursor = custom_db.conn.cursor()
+        
+        self.assertEqual(cursor.execute("PRAGMA cache_size").fetchone()[0], -2000)
+        self.assertEqual(cursor.execute("PRAGMA temp_store").fetchone()[0], 0)  # DEFAULT
+    
     def test_add_stamp(self):
         """Test adding a stamp to the database"""
         stamp_id = self.db_manager.add_stamp(self.test_stamp1)
@@ -211,21 +319,29 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertGreater(stamp_id, 0)
         
         # Verify stamp was added
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM stamps WHERE id=?", (stamp_id,))
-        result = cursor.fetchone()
-        conn.close()
+        result = self.db_manager.execute("SELECT * FROM stamps WHERE id=?", (stamp_id,)).fetchone()
         
         self.assertIsNotNone(result)
         self.assertEqual(result[1], "TEST001")  # scott_number
         self.assertEqual(result[2], "Test Stamp 1")  # description
     
+    def test_add_stamps_bulk(self):
+        """Test adding several stamps in one transaction"""
+        first_id = self.db_manager.add_stamp(self.test_stamp1)
+        
+        stamp_ids = self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
+        
+        self.assertEqual(stamp_ids, [first_id + 1, first_id + 2])
+        
+        rows = self.db_manager.execute("SELECT id, scott_number FROM stamps ORDER BY id").fetchall()
+        
+        self.assertEqual(rows[1:], [(stamp_ids[0], "TEST001"), (stamp_ids[1], "TEST002")])
+        self.assertEqual(self.db_manager.add_stamps_bulk([]), [])
+    
     def test_load_collection(self):
         """Test loading stamps from database into collection"""
         # Add stamps to database
-        self.db_manager.add_stamp(self.test_stamp1)
-        self.db_manager.add_stamp(self.test_stamp2)
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         # Load collection
         collection = self.db_manager.load_collection()
@@ -281,10 +397,94 @@ class TestDatabaseManager(unittest.TestCase):
         collection = self.db_manager.load_collection()
         self.assertEqual(len(collection.stamps), 0)
     
+    def test_delete_stamps(self):
+        """Test deleting several stamps in one call"""
+        stamp_ids = self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2, self.test_stamp1])
+        
+        self.db_manager.delete_stamps(stamp_ids[:2])
+        self.db_manager.delete_stamps([])
+        
+        results = self.db_manager.list_all_stamps()
+        self.assertEqual([stamp_id for stamp_id, _ in results], stamp_ids[2:])
+    
+    def test_csv_export_import_round_trip(self):
+        """Test exporting stamps to CSV and importing them into another database"""
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
+        
+        with tempfile.TemporaryDirectory(dir=_TEST_TMPDIR) as temp_dir:
+            path = os.path.join(temp_dir, "stamps.csv")
+            self.assertEqual(self.db_manager.export_csv(path), 2)
+            
+            other_db = self.DatabaseManager(":memory:")
+            self.addCleanup(other_db.close)
+            self.assertEqual(other_db.import_csv(path, batch=1), 2)
+            imported = [stamp for _, stamp in other_db.list_all_stamps()]
+        
+        self.assertEqual(imported, [self.test_stamp1, self.test_stamp2])
+    
+    def test_csv_import_rolls_back_on_bad_row(self):
+        """Test that an import with an invalid row adds nothing"""
+        with tempfile.TemporaryDirectory(dir=_TEST_TMPDIR) as temp_dir:
+            path = os.path.join(temp_dir, "bad.csv")
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                f.write("scott_number,description,year\n")
+                f.write("OK001,Good row,1990\n")
+                f.write("BAD001,Bad row,not-a-year\n")
+            
+            with self.assertRaisesRegex(ValueError, r"row 3: invalid year 'not-a-year'"):
+                self.db_manager.import_csv(path, batch=1)
+        
+        self.assertEqual(self.db_manager.list_all_stamps(), [])
+    
+    def test_csv_import_requires_scott_number_and_description(self):
+        """Test that a row missing a required field is reported by row number"""
+        with tempfile.TemporaryDirectory(dir=_TEST_TMPDIR) as temp_dir:
+            path = os.path.join(temp_dir, "missing.csv")
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                f.write("scott_number,description\n")
+                f.write("OK001,Good row\n")
+                f.write(",No Scott number\n")
+            
+            with self.assertRaisesRegex(ValueError, "row 3: scott_number is required"):
+                self.db_manager.import_csv(path)
+        
+        self.assertEqual(self.db_manager.list_all_stamps(), [])
+    
+    def test_list_all_stamps(self):
+        """Test listing every stamp with its ID"""
+        stamp_ids = self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
+        
+        results = self.db_manager.list_all_stamps()
+        
+        self.assertEqual([stamp_id for stamp_id, _ in results], stamp_ids)
+        self.assertEqual([stamp.scott_number for _, stamp in results], ["TEST001", "TEST002"])
+    
+    def test_list_columns_projection(self):
+        """Test that a column projection leaves unread fields at their defaults"""
+        from database_manager import LIST_COLUMNS
+        
+        detailed = Stamp(scott_number="PROJ001", description="Projected", country="USA",
+                         notes="Long notes", image_path="/images/proj.jpg",
+                         catalog_value_mint=Decimal('2.50'), qty_mint=4)
+        stamp_id = self.db_manager.add_stamp(detailed)
+        
+        [(listed_id, listed)] = self.db_manager.list_all_stamps(columns=LIST_COLUMNS)
+        [(found_id, found)] = self.db_manager.search_stamps(
+            {'description': 'Projected', 'scott_number': '', 'country': '', 'year_from': '',
+             'year_to': '', 'used_only': False, 'want_list': False}, columns=LIST_COLUMNS)
+        
+        for result_id, stamp in ((listed_id, listed), (found_id, found)):
+            self.assertEqual(result_id, stamp_id)
+            self.assertEqual(stamp.country, "USA")
+            self.assertEqual(stamp.calculate_total_value(), Decimal('10.00'))
+            self.assertIsNone(stamp.notes)
+            self.assertIsNone(stamp.image_path)
+        self.assertEqual(self.db_manager.get_stamp(stamp_id).notes, "Long notes")
+        self.assertIsNone(self.db_manager.get_stamp(stamp_id + 1))
+    
     def test_search_stamps_by_description(self):
         """Test searching stamps by description"""
-        self.db_manager.add_stamp(self.test_stamp1)
-        self.db_manager.add_stamp(self.test_stamp2)
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         criteria = {
             'description': 'Test Stamp 1',
@@ -303,8 +503,7 @@ class TestDatabaseManager(unittest.TestCase):
     
     def test_search_stamps_by_scott_number(self):
         """Test searching stamps by Scott number"""
-        self.db_manager.add_stamp(self.test_stamp1)
-        self.db_manager.add_stamp(self.test_stamp2)
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         criteria = {
             'description': '',
@@ -323,8 +522,8 @@ class TestDatabaseManager(unittest.TestCase):
     
     def test_search_stamps_by_year_range(self):
         """Test searching stamps by year range"""
-        self.db_manager.add_stamp(self.test_stamp1)  # 1990
-        self.db_manager.add_stamp(self.test_stamp2)  # 1995
+        # test_stamp1: 1990; test_stamp2: 1995
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         criteria = {
             'description': '',
@@ -343,8 +542,8 @@ class TestDatabaseManager(unittest.TestCase):
     
     def test_search_stamps_used_only(self):
         """Test searching for used stamps only"""
-        self.db_manager.add_stamp(self.test_stamp1)  # mint
-        self.db_manager.add_stamp(self.test_stamp2)  # used
+        # test_stamp1: mint; test_stamp2: used
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         criteria = {
             'description': '',
@@ -364,8 +563,8 @@ class TestDatabaseManager(unittest.TestCase):
     
     def test_search_stamps_want_list(self):
         """Test searching for want list items"""
-        self.db_manager.add_stamp(self.test_stamp1)  # not on want list
-        self.db_manager.add_stamp(self.test_stamp2)  # on want list
+        # test_stamp1: not on want list; test_stamp2: on want list
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         criteria = {
             'description': '',
@@ -383,6 +582,39 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(results[0][1].scott_number, "TEST002")
         self.assertTrue(results[0][1].want_list)
     
+    def test_search_sql_cached_per_criteria_shape(self):
+        """Test that searches with the same criteria keys reuse one SQL string"""
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
+        self.db_manager._search_sql.clear()
+        
+        criteria = {
+            'description': '',
+            'scott_number': 'TEST001',
+            'country': '',
+            'year_from': '',
+            'year_to': '',
+            'used_only': False,
+            'want_list': False
+        }
+        
+        first = self.db_manager.search_stamps(criteria)
+        criteria['scott_number'] = 'TEST002'
+        second = self.db_manager.search_stamps(criteria)
+        
+        self.assertEqual(first[0][1].scott_number, "TEST001")
+        self.assertEqual(second[0][1].scott_number, "TEST002")
+        self.assertEqual(self.db_manager._search_sql,
+                         {(('scott_number',), None): 'SELECT * FROM stamps WHERE scott_number LIKE ?'})
+    
+    def test_search_uses_index(self):
+        """Test that exact-match filters are answered from an index"""
+        for query, index in (("SELECT * FROM stamps WHERE country=?", "idx_search"),
+                             ("SELECT * FROM stamps WHERE scott_number=?", "idx_scott")):
+            plan = self.db_manager.execute("EXPLAIN QUERY PLAN " + query, ("USA",)).fetchall()
+            detail = " ".join(row[3] for row in plan)
+        
+            self.assertIn(f"USING INDEX {index}", detail)
+    
     def test_get_statistics_empty_db(self):
         """Test statistics with empty database"""
         stats = self.db_manager.get_statistics()
@@ -398,8 +630,8 @@ class TestDatabaseManager(unittest.TestCase):
     
     def test_get_statistics_with_stamps(self):
         """Test statistics with stamps in database"""
-        self.db_manager.add_stamp(self.test_stamp1)  # mint, $10.00
-        self.db_manager.add_stamp(self.test_stamp2)  # used, $5.00 * 2 = $10.00
+        # test_stamp1: mint, $10.00; test_stamp2: used, $5.00 * 2 = $10.00
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
         
         stats = self.db_manager.get_statistics()
         
@@ -412,6 +644,18 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(stats['want_list_items'], 1)
         self.assertEqual(stats['for_sale_items'], 0)
     
+    def test_get_statistics_does_not_build_stamps(self):
+        """Test that statistics are aggregated in SQL without loading Stamp objects"""
+        self.db_manager.add_stamps_bulk([self.test_stamp1, self.test_stamp2])
+        
+        with patch.object(self.db_manager, '_create_stamp_from_row') as mock_create, \
+             patch.object(self.db_manager, 'load_collection') as mock_load:
+            stats = self.db_manager.get_statistics()
+        
+        self.assertEqual(stats['total_stamps'], 2)
+        mock_create.assert_not_called()
+        mock_load.assert_not_called()
+    
     def test_create_stamp_from_row_valid_data(self):
         """Test creating stamp from database row with valid data"""
         # Simulate a database row (id is at index 0)
@@ -509,23 +753,9 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(tuple_data[3], 1990)  # year
 
 
-class TestDatabaseIntegration(unittest.TestCase):
+class TestDatabaseIntegration(_SharedDatabaseTestCase):
     """Integration tests for database operations"""
     
-    def setUp(self):
-        """Set up test fixtures with temporary database"""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        self.db_manager = DatabaseManager(self.db_path)
-    
-    def tearDown(self):
-        """Clean up after tests"""
-        try:
-            os.unlink(self.db_path)
-        except OSError:
-            pass
-    
     def test_full_crud_operations(self):
         """Test complete CRUD (Create, Read, Update, Delete) operations"""
         # Create
@@ -584,8 +814,7 @@ class TestDatabaseIntegration(unittest.TestCase):
             Stamp("UK001", "Queen Victoria", "UK", 1840, catalog_value_mint=Decimal('500.00'), qty_mint=1),
         ]
         
-        for stamp in stamps:
-            self.db_manager.add_stamp(stamp)
+        self.db_manager.add_stamps_bulk(stamps)
         
         # Test search by country and year range
         criteria = {
@@ -656,27 +885,8 @@ class TestDataValidation(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create a test suite combining all test cases
-    test_classes = [
-        TestStamp,
-        TestStampCollection,
-        TestDatabaseManager,
-        TestDatabaseIntegration,
-        TestDataValidation
-    ]
-    
-    loader = unittest.TestLoader()
-    suites = [loader.loadTestsFromTestCase(test_class) for test_class in test_classes]
-    combined_suite = unittest.TestSuite(suites)
-    
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(combined_suite)
-    
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"TESTS RUN: {result.testsRun}")
-    print(f"FAILURES: {len(result.failures)}")
-    print(f"ERRORS: {len(result.errors)}")
-    print(f"SUCCESS RATE: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
-    print(f"{'='*50}")
\ No newline at end of file
+    # pytest.ini runs the classes in parallel (-n auto --dist=loadscope);
+    # the unittest classes still work under python -m unittest
+    import sys
+    import pytest
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -7,14 +7,288 @@ This version eliminates all sizer parent-child relationship errors
 import wx
 import wx.grid
 import wx.adv
-from decimal import Decimal, InvalidOperation
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from datetime import datetime
+import functools
+import operator
 import os
+import re
+import string
+from types import MappingProxyType
 
 # Import existing backend modules
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, LIST_COLUMNS
 from enhanced_stamp import Stamp
 
+# Pillow is optional; with it, JPEG previews decode at reduced resolution
+try:
+    from PIL import Image as PILImage
+    HAS_PIL = True
+except ImportError:
+    PILImage = None
+    HAS_PIL = False
+
+
+# Choice lists for the edit form, shared by every EditPanel
+CONDITION_CHOICES = ('Unknown', 'Poor', 'Fair', 'Fine', 'Very Fine', 'Extremely Fine', 'Superb')
+GUM_CHOICES = ('Unknown', 'Mint NH', 'Hinged', 'Heavily Hinged', 'No Gum')
+
+# Image files the browse dialog offers and the preview will try to decode
+IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+IMAGE_WILDCARD = "Image files (*.jpg;*.jpeg;*.png;*.gif)|*.jpg;*.jpeg;*.png;*.gif"
+CSV_WILDCARD = "CSV files (*.csv)|*.csv"
+
+# Created on first use: wx.Font needs a running wx.App
+_MONO_FONT = None
+
+
+def _mono_font():
+    """Shared fixed-width font for text displays"""
+    global _MONO_FONT
+    if _MONO_FONT is None:
+        _MONO_FONT = wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+    return _MONO_FONT
+
+
+# Accepted format for the price fields, checked before any Decimal is built
+_MONEY_RE = re.compile(r'^[+-]?(\d+(\.\d*)?|\.\d+)$')
+_ZERO = Decimal('0.00')
+
+
+def _parse_money(text):
+    """Decimal for a validated price field; the untouched "0.00" default skips parsing"""
+    text = text.strip()
+    return _ZERO if text == "0.00" else Decimal(text)
+
+
+# Search criteria that match every stamp; read-only so it can be shared
+_EMPTY_CRITERIA = MappingProxyType({
+    'description': '',
+    'scott_number': '',
+    'country': '',
+    'year_from': '',
+    'year_to': '',
+    'used_only': False,
+    'want_list': False
+})
+
+# Criteria matched as case-insensitive substrings, like SQLite's LIKE
+_TEXT_CRITERIA = ('description', 'scott_number', 'country')
+# Criteria that only restrict results when switched on
+_FLAG_CRITERIA = {'used_only': 'used', 'want_list': 'want_list'}
+# LIKE only folds ASCII letters, so str.lower() could match rows SQLite would not
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _fold(text):
+    """Lower-case text the way SQLite's LIKE compares it"""
+    return text.translate(_ASCII_LOWER)
+
+
+def _narrows(old, new):
+    """True if every result for `new` must also be a result for `old`"""
+    if old is None:
+        return False
+    for key in _TEXT_CRITERIA:
+        # LIKE wildcards have no plain-substring equivalent
+        if '%' in new[key] or '_' in new[key]:
+            return False
+        if _fold(old[key]) not in _fold(new[key]):
+            return False
+    for key in _FLAG_CRITERIA:
+        if old[key] and not new[key]:
+            return False
+    return old['year_from'] == new['year_from'] and old['year_to'] == new['year_to']
+
+
+def _matches(stamp, criteria):
+    """Python-side equivalent of DatabaseManager.search_stamps for one stamp"""
+    for key in _TEXT_CRITERIA:
+        needle = _fold(criteria[key])
+        if needle and needle not in _fold(getattr(stamp, key) or ""):
+            return False
+    for key, attr in _FLAG_CRITERIA.items():
+        if criteria[key] and not getattr(stamp, attr):
+            return False
+    return True
+
+
+def _bloom_for(text):
+    """64-bit signature with one bit set per character bigram of text"""
+    bits = 0
+    for i in range(len(text) - 1):
+        bits |= 1 << (hash(text[i:i + 2]) & 63)
+    return bits
+
+
+def _stamp_bloom(stamp):
+    """Bloom signature over all of a stamp's searchable text"""
+    return _bloom_for("\0".join(_fold(getattr(stamp, key) or "") for key in _TEXT_CRITERIA))
+
+
+def _add_labeled_rows(grid_sizer, parent, fields):
+    """Add a label/control row to grid_sizer for each (label, control) pair"""
+    for label_text, control in fields:
+        grid_sizer.Add(wx.StaticText(parent, label=label_text), 0, wx.ALIGN_CENTER_VERTICAL)
+        grid_sizer.Add(control, 1, wx.EXPAND)
+
+
+_ROW_FIELDS = operator.attrgetter('scott_number', 'description', 'country', 'year', 'condition_grade')
+
+
+def _format_row(stamp_id, stamp):
+    """Build the display strings for one grid row"""
+    scott_number, description, country, year, condition_grade = _ROW_FIELDS(stamp)
+    if len(description) > 40:
+        description = description[:37] + "..."
+    return (
+        str(stamp_id or "New"),
+        scott_number,
+        description,
+        country or "",
+        str(year) if year else "",
+        condition_grade,
+        f"${stamp.calculate_total_value():.2f}",
+    )
+
+
+def _load_thumbnail(path, size):
+    """Decode an image file and scale it to fit size; None if it can't be read
+    
+    Runs on a worker thread, so it only builds a wx.Image; the GUI thread
+    turns that into a bitmap.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _decode_thumbnail(path, mtime, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_thumbnail(path, mtime, size):
+    """Cached body of _load_thumbnail; mtime is in the key so edited files are decoded again"""
+    if HAS_PIL and os.path.splitext(path)[1].lower() in ('.jpg', '.jpeg'):
+        try:
+            with PILImage.open(path) as image:
+                # Draft mode lets libjpeg decode straight to a fraction of full size
+                image.draft('RGB', size)
+                image = image.convert('RGB')
+                image.thumbnail(size)
+                return wx.Image(image.width, image.height, image.tobytes())
+        except OSError:
+            return None
+    
+    if not wx.Image.CanRead(path):
+        return None
+    image = wx.Image(path)
+    if not image.IsOk():
+        return None
+    width, height = image.GetSize()
+    scale = min(size[0] / width, size[1] / height, 1.0)
+    return image.Scale(max(1, int(width * scale)), max(1, int(height * scale)), wx.IMAGE_QUALITY_HIGH)
+
+
+class StampTable(wx.grid.GridTableBase):
+    """Virtual table over (stamp_id, stamp) pairs; rows are formatted only when the grid draws them"""
+    
+    COLUMNS = ("ID", "Scott #", "Description", "Country", "Year", "Condition", "Value")
+    
+    def __init__(self, row_cache=None):
+        super().__init__()
+        self.data = []
+        # Formatted rows by stamp ID, possibly shared with the frame
+        self.row_cache = {} if row_cache is None else row_cache
+    
+    def GetNumberRows(self):
+        return len(self.data)
+    
+    def GetNumberCols(self):
+        return len(self.COLUMNS)
+    
+    def GetColLabelValue(self, col):
+        return self.COLUMNS[col]
+    
+    def GetRow(self, row):
+        """Display strings for one row, formatted on first request"""
+        stamp_id, stamp = self.data[row]
+        cells = self.row_cache.get(stamp_id)
+        if cells is None:
+            cells = _format_row(stamp_id, stamp)
+            # Unsaved stamps have no ID to key on
+            if stamp_id is not None:
+                self.row_cache[stamp_id] = cells
+        return cells
+    
+    def GetValue(self, row, col):
+        try:
+            return self.GetRow(row)[col]
+        except IndexError:
+            return ""
+    
+    def SetValue(self, row, col, value):
+        """Cells are read-only"""
+    
+    def IsEmptyCell(self, row, col):
+        return not self.GetValue(row, col)
+    
+    def SetData(self, rows):
+        """Replace the table contents and tell the view how the row count changed"""
+        old_rows = self.data
+        self.data = rows
+        old_count = len(old_rows)
+        new_count = len(rows)
+        
+        view = self.GetView()
+        if view is None:
+            return
+        
+        if new_count == old_count:
+            # Same shape: repaint only the span of rows that differ, if any
+            changed = [i for i, (old, new) in enumerate(zip(old_rows, rows))
+                       if old is not new and old != new]
+            if changed:
+                view.RefreshBlock(changed[0], 0, changed[-1], len(self.COLUMNS) - 1)
+            return
+        
+        view.BeginBatch()
+        try:
+            if new_count < old_count:
+                view.ProcessTableMessage(wx.grid.GridTableMessage(
+                    self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, new_count, old_count - new_count))
+            else:
+                view.ProcessTableMessage(wx.grid.GridTableMessage(
+                    self, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, new_count - old_count))
+            view.ForceRefresh()
+        finally:
+            view.EndBatch()
+    
+    def RemoveStamps(self, stamp_ids):
+        """Drop the rows of the given stamps, telling the view only which rows went"""
+        removed = [i for i, (stamp_id, _) in enumerate(self.data) if stamp_id in stamp_ids]
+        if not removed:
+            return
+        self.data = [item for item in self.data if item[0] not in stamp_ids]
+        
+        view = self.GetView()
+        if view is None:
+            return
+        
+        view.BeginBatch()
+        try:
+            # One message per run of adjacent rows, last run first so positions stay valid
+            end = len(removed)
+            while end:
+                start = end - 1
+                while start and removed[start - 1] == removed[start] - 1:
+                    start -= 1
+                view.ProcessTableMessage(wx.grid.GridTableMessage(
+                    self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, removed[start], end - start))
+                end = start
+        finally:
+            view.EndBatch()
+
 
 class StampGrid(wx.grid.Grid):
     """Custom grid for displaying stamps"""
@@ -23,15 +297,9 @@ class StampGrid(wx.grid.Grid):
         super().__init__(parent)
         self.main_frame = main_frame
         
-        # Grid setup
-        self.CreateGrid(0, 7)
-        self.SetColLabelValue(0, "ID")
-        self.SetColLabelValue(1, "Scott #")
-        self.SetColLabelValue(2, "Description")
-        self.SetColLabelValue(3, "Country")
-        self.SetColLabelValue(4, "Year")
-        self.SetColLabelValue(5, "Condition")
-        self.SetColLabelValue(6, "Value")
+        # Grid setup; the table owns the data and column labels
+        self.table = StampTable(getattr(main_frame, '_row_cache', None))
+        self.SetTable(self.table, True)
         
         # Column widths
         self.SetColSize(0, 50)
@@ -42,8 +310,14 @@ class StampGrid(wx.grid.Grid):
         self.SetColSize(5, 100)
         self.SetColSize(6, 80)
         
-        # Make grid read-only
+        # Make grid read-only; whole-row selection lets several stamps be deleted at once
         self.EnableEditing(False)
+        self.SetSelectionMode(wx.grid.Grid.GridSelectRows)
+        
+        # Avoid flicker while rows are rewritten; GTK3 and macOS already
+        # composite every window, so buffering again there only costs a blit
+        if wx.Platform == '__WXMSW__':
+            self.SetDoubleBuffered(True)
         
         # Bind events
         self.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.OnDoubleClick)
@@ -57,28 +331,14 @@ class StampGrid(wx.grid.Grid):
 
     def UpdateData(self, stamps_data):
         """Update grid with new stamp data"""
-        # Clear existing data
-        if self.GetNumberRows() > 0:
-            self.DeleteRows(0, self.GetNumberRows())
-        
-        # Add new data
-        for i, (stamp_id, stamp) in enumerate(stamps_data):
-            self.AppendRows(1)
-            self.SetCellValue(i, 0, str(stamp_id or "New"))
-            self.SetCellValue(i, 1, stamp.scott_number)
-            description = stamp.description
-            if len(description) > 40:
-                description = description[:37] + "..."
-            self.SetCellValue(i, 2, description)
-            self.SetCellValue(i, 3, stamp.country or "")
-            self.SetCellValue(i, 4, str(stamp.year) if stamp.year else "")
-            self.SetCellValue(i, 5, stamp.condition_grade)
-            self.SetCellValue(i, 6, f"${stamp.calculate_total_value():.2f}")
+        self.table.SetData(list(stamps_data))
 
 
 class BrowsePanel(wx.Panel):
     """Browse and search panel"""
     
+    SEARCH_DELAY_MS = 150
+    
     def __init__(self, parent, main_frame=None):
         super().__init__(parent)
         self.main_frame = main_frame
@@ -99,9 +359,15 @@ class BrowsePanel(wx.Panel):
         # Grid - pass main_frame reference
         self.stamp_grid = StampGrid(self, main_frame=self.main_frame)
         
+        # Typing searches live, but only once input pauses for SEARCH_DELAY_MS
+        self._search_timer = wx.Timer(self)
+        
         # Bind events
         self.search_btn.Bind(wx.EVT_BUTTON, self.OnSearch)
         self.clear_btn.Bind(wx.EVT_BUTTON, self.OnClear)
+        for control in (self.search_desc, self.search_scott, self.search_country):
+            control.Bind(wx.EVT_TEXT, self._on_text_changed)
+        self.Bind(wx.EVT_TIMER, self.OnSearch, self._search_timer)
     
     def DoLayout(self):
         """Layout controls"""
@@ -122,9 +388,7 @@ class BrowsePanel(wx.Panel):
             ("Country:", self.search_country),
         ]
         
-        for label_text, control in fields:
-            search_grid.Add(wx.StaticText(self, label=label_text), 0, wx.ALIGN_CENTER_VERTICAL)
-            search_grid.Add(control, 1, wx.EXPAND)
+        _add_labeled_rows(search_grid, self, fields)
         
         search_sizer.Add(search_grid, 0, wx.EXPAND | wx.ALL, 5)
         
@@ -144,8 +408,15 @@ class BrowsePanel(wx.Panel):
         
         self.SetSizer(main_sizer)
     
+    def _on_text_changed(self, event):
+        """Restart the search delay on every keystroke"""
+        self._search_timer.Stop()
+        self._search_timer.StartOnce(self.SEARCH_DELAY_MS)
+        event.Skip()
+    
     def OnSearch(self, event):
         """Handle search"""
+        self._search_timer.Stop()
         if self.main_frame and hasattr(self.main_frame, 'OnSearch'):
             self.main_frame.OnSearch(event)
     
@@ -158,6 +429,9 @@ class BrowsePanel(wx.Panel):
 class EditPanel(wx.Panel):
     """Edit/Add stamp panel"""
     
+    NOTES_SIZE = (-1, 100)
+    PREVIEW_SIZE = (120, 120)
+    
     def __init__(self, parent, main_frame=None):
         super().__init__(parent)
         self.main_frame = main_frame
@@ -183,12 +457,10 @@ class EditPanel(wx.Panel):
         self.perforation = wx.TextCtrl(self.scroll)
         
         # Condition controls
-        condition_choices = ['Unknown', 'Poor', 'Fair', 'Fine', 'Very Fine', 'Extremely Fine', 'Superb']
-        self.condition_grade = wx.Choice(self.scroll, choices=condition_choices)
+        self.condition_grade = wx.Choice(self.scroll, choices=CONDITION_CHOICES)
         self.condition_grade.SetSelection(0)
         
-        gum_choices = ['Unknown', 'Mint NH', 'Hinged', 'Heavily Hinged', 'No Gum']
-        self.gum_condition = wx.Choice(self.scroll, choices=gum_choices)
+        self.gum_condition = wx.Choice(self.scroll, choices=GUM_CHOICES)
         self.gum_condition.SetSelection(0)
         
         # Quantity controls
@@ -211,9 +483,10 @@ class EditPanel(wx.Panel):
         # Other field controls
         self.source = wx.TextCtrl(self.scroll)
         self.date_acquired = wx.TextCtrl(self.scroll)
-        self.notes = wx.TextCtrl(self.scroll, style=wx.TE_MULTILINE, size=wx.Size(-1, 100))
+        self.notes = wx.TextCtrl(self.scroll, style=wx.TE_MULTILINE, size=self.NOTES_SIZE)
         self.image_path = wx.TextCtrl(self.scroll)
         self.browse_btn = wx.Button(self.scroll, label="Browse...")
+        self.preview = wx.StaticBitmap(self.scroll, size=self.PREVIEW_SIZE)
         
         # Action button controls
         self.add_btn = wx.Button(self.scroll, label="Add Stamp")
@@ -254,9 +527,7 @@ class EditPanel(wx.Panel):
             ("Perforation:", self.perforation),
         ]
         
-        for label_text, control in basic_fields:
-            basic_grid.Add(wx.StaticText(self.scroll, label=label_text), 0, wx.ALIGN_CENTER_VERTICAL)
-            basic_grid.Add(control, 1, wx.EXPAND)
+        _add_labeled_rows(basic_grid, self.scroll, basic_fields)
         
         basic_sizer.Add(basic_grid, 0, wx.EXPAND | wx.ALL, 5)
         scroll_sizer.Add(basic_sizer, 0, wx.EXPAND | wx.ALL, 5)
@@ -276,9 +547,7 @@ class EditPanel(wx.Panel):
             ("Cat Val Used:", self.catalog_value_used),
         ]
         
-        for label_text, control in condition_fields:
-            condition_grid.Add(wx.StaticText(self.scroll, label=label_text), 0, wx.ALIGN_CENTER_VERTICAL)
-            condition_grid.Add(control, 1, wx.EXPAND)
+        _add_labeled_rows(condition_grid, self.scroll, condition_fields)
         
         condition_sizer.Add(condition_grid, 0, wx.EXPAND | wx.ALL, 5)
         
@@ -305,9 +574,7 @@ class EditPanel(wx.Panel):
             ("Date Acquired:", self.date_acquired),
         ]
         
-        for label_text, control in financial_fields:
-            financial_grid.Add(wx.StaticText(self.scroll, label=label_text), 0, wx.ALIGN_CENTER_VERTICAL)
-            financial_grid.Add(control, 1, wx.EXPAND)
+        _add_labeled_rows(financial_grid, self.scroll, financial_fields)
         
         financial_sizer.Add(financial_grid, 0, wx.EXPAND | wx.ALL, 5)
         scroll_sizer.Add(financial_sizer, 0, wx.EXPAND | wx.ALL, 5)
@@ -323,7 +590,8 @@ class EditPanel(wx.Panel):
         image_sizer = wx.StaticBoxSizer(image_box, wx.HORIZONTAL)
         image_sizer.Add(wx.StaticText(self.scroll, label="Path:"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
         image_sizer.Add(self.image_path, 1, wx.EXPAND | wx.RIGHT, 5)
-        image_sizer.Add(self.browse_btn, 0)
+        image_sizer.Add(self.browse_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        image_sizer.Add(self.preview, 0)
         scroll_sizer.Add(image_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
         # Buttons section
@@ -366,6 +634,11 @@ class EditPanel(wx.Panel):
         """Browse for image"""
         if self.main_frame and hasattr(self.main_frame, 'OnBrowseImage'):
             self.main_frame.OnBrowseImage(event)
+    
+    def SetPreview(self, image):
+        """Show a decoded thumbnail image, or clear the preview for None"""
+        self.preview.SetBitmap(image.ConvertToBitmap() if image is not None else wx.NullBitmap)
+        self.scroll.Layout()
 
 
 class StatsPanel(wx.Panel):
@@ -379,7 +652,7 @@ class StatsPanel(wx.Panel):
     def CreateControls(self):
         """Create statistics controls"""
         self.stats_text = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        self.stats_text.SetFont(wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        self.stats_text.SetFont(_mono_font())
     
     def DoLayout(self):
         """Layout statistics controls"""
@@ -392,13 +665,45 @@ class StatsPanel(wx.Panel):
 class StampFrame(wx.Frame):
     """Main application frame"""
     
+    # A burst of add/update/delete operations reloads the list once, this long after the last
+    REFRESH_DELAY_MS = 50
+    
     def __init__(self):
         super().__init__(None, title="Professional Stamp Collection Manager", 
                         size=wx.Size(1200, 800))
         
-        # Initialize database
-        self.db_manager = DatabaseManager()
+        # Initialize database; reads run on worker threads, each on its own read-only
+        # connection, so the UI never blocks and writes don't wait behind queries
+        self.db_manager = DatabaseManager(check_same_thread=False, readers=2)
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Image previews decode on their own threads so they never queue behind queries
+        self._image_pool = ThreadPoolExecutor(max_workers=2)
+        # Latest request per result channel; older results arriving late are dropped
+        self._generations = {}
         self.search_results = []
+        # Criteria behind search_results, so narrower searches can filter them in memory
+        self._last_criteria = None
+        # Criteria of the newest search, which may still be running
+        self._requested_criteria = None
+        # Unfiltered stamp list; None marks it stale after add/update/delete
+        self._all_stamps_cache = None
+        # Rendered statistics text, recomputed only after the collection changes
+        self._stats_cache = None
+        self._stats_dirty = True
+        self._stats_last_hash = None
+        # Image file dialog, created on first use and reused
+        self._image_dlg = None
+        self._last_image_dir = None
+        # Non-modal success notice, created on first use and reused
+        self._notification = None
+        # About box contents, built the first time it is shown
+        self._about_info = None
+        # Formatted grid rows by stamp ID; entries are dropped when a stamp changes
+        self._row_cache = {}
+        # Bigram Bloom signatures by stamp ID for the in-memory search filter
+        self._blooms = {}
+        # Pending list reload after a change; see _ScheduleRefresh
+        self._refresh_timer = None
         
         self.CreateMenuBar()
         self.CreateStatusBar()
@@ -408,6 +713,9 @@ class StampFrame(wx.Frame):
         # Load initial data
         self.RefreshStampList()
         
+        # Release the database connection however the frame is closed
+        self.Bind(wx.EVT_CLOSE, self.OnClose)
+        
         # Center window
         self.Center()
     
@@ -417,6 +725,9 @@ class StampFrame(wx.Frame):
         
         # File menu
         file_menu = wx.Menu()
+        import_item = file_menu.Append(wx.ID_ANY, "&Import CSV...")
+        export_item = file_menu.Append(wx.ID_ANY, "E&xport CSV...")
+        file_menu.AppendSeparator()
         file_menu.Append(wx.ID_EXIT, "E&xit\tCtrl+Q")
         
         # Edit menu
@@ -436,6 +747,8 @@ class StampFrame(wx.Frame):
         self.SetMenuBar(menubar)
         
         # Bind menu events
+        self.Bind(wx.EVT_MENU, self.OnImportCSV, id=import_item.GetId())
+        self.Bind(wx.EVT_MENU, self.OnExportCSV, id=export_item.GetId())
         self.Bind(wx.EVT_MENU, self.OnExit, id=wx.ID_EXIT)
         self.Bind(wx.EVT_MENU, self.OnAbout, id=wx.ID_ABOUT)
         self.Bind(wx.EVT_MENU, self.OnMenuAdd, id=wx.ID_ADD)
@@ -455,17 +768,49 @@ class StampFrame(wx.Frame):
         
         # Create panels - pass reference to self (main frame)
         self.browse_panel = BrowsePanel(self.notebook, main_frame=self)
-        self.edit_panel = EditPanel(self.notebook, main_frame=self)
-        self.stats_panel = StatsPanel(self.notebook)
+        
+        # The edit and statistics panels are built on first use (see the
+        # edit_panel/stats_panel properties); their tabs start as empty hosts
+        self._edit_panel = None
+        self._stats_panel = None
+        self.edit_page = self._CreatePageHost()
+        self.stats_page = self._CreatePageHost()
         
         # Add panels to notebook
         self.notebook.AddPage(self.browse_panel, "Browse Collection")
-        self.notebook.AddPage(self.edit_panel, "Add/Edit Stamps")
-        self.notebook.AddPage(self.stats_panel, "Statistics")
+        self.notebook.AddPage(self.edit_page, "Add/Edit Stamps")
+        self.notebook.AddPage(self.stats_page, "Statistics")
         
         # Bind notebook events
         self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.OnPageChanged)
     
+    def _CreatePageHost(self):
+        """Empty notebook page that a lazily built panel is later placed into"""
+        page = wx.Panel(self.notebook)
+        page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        return page
+    
+    def _FillPageHost(self, page, panel):
+        """Place panel inside its host page"""
+        page.GetSizer().Add(panel, 1, wx.EXPAND)
+        page.Layout()
+        return panel
+    
+    @property
+    def edit_panel(self):
+        """Add/Edit panel, created the first time it is needed"""
+        if self._edit_panel is None:
+            self._edit_panel = self._FillPageHost(
+                self.edit_page, EditPanel(self.edit_page, main_frame=self))
+        return self._edit_panel
+    
+    @property
+    def stats_panel(self):
+        """Statistics panel, created the first time it is needed"""
+        if self._stats_panel is None:
+            self._stats_panel = self._FillPageHost(self.stats_page, StatsPanel(self.stats_page))
+        return self._stats_panel
+    
     def CreateLayout(self):
         """Create main layout"""
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -478,65 +823,130 @@ class StampFrame(wx.Frame):
         page = event.GetSelection()
         if page == 2:  # Statistics tab
             self.UpdateStatistics()
+        elif page == 1:  # Add/Edit tab
+            self.edit_panel  # builds the panel on first visit
         elif page == 0:  # Browse tab
             self.RefreshStampList()
     
     def OnSearch(self, event):
         """Perform search"""
-        criteria = {
-            'description': self.browse_panel.search_desc.GetValue(),
-            'scott_number': self.browse_panel.search_scott.GetValue(),
-            'country': self.browse_panel.search_country.GetValue(),
-            'year_from': '',
-            'year_to': '',
-            'used_only': self.browse_panel.search_used.GetValue(),
-            'want_list': self.browse_panel.search_want.GetValue()
-        }
+        criteria = dict(
+            _EMPTY_CRITERIA,
+            description=self.browse_panel.search_desc.GetValue(),
+            scott_number=self.browse_panel.search_scott.GetValue(),
+            country=self.browse_panel.search_country.GetValue(),
+            used_only=self.browse_panel.search_used.GetValue(),
+            want_list=self.browse_panel.search_want.GetValue()
+        )
+        
+        # Nothing changed since the last request (e.g. the timer and button both fired)
+        if criteria == self._requested_criteria:
+            return
+        self._requested_criteria = criteria
         
+        if _narrows(self._last_criteria, criteria):
+            # Refining the previous query: its results are a superset
+            self._next_generation('stamps')
+            self._show_results(criteria, self._filter_results(criteria), "Found")
+        else:
+            self._run_query('stamps', "Search error",
+                           lambda results: self._show_results(criteria, results, "Found"),
+                           self.db_manager.search_stamps, criteria, LIST_COLUMNS)
+    
+    def _show_results(self, criteria, results, verb):
+        """Display query results in the grid (GUI thread)"""
+        self.search_results = results
+        self._last_criteria = criteria
+        self.browse_panel.stamp_grid.UpdateData(results)
+        self.statusbar.SetStatusText(f"{verb} {len(results)} stamps")
+    
+    def _next_generation(self, channel):
+        """Start a new request on channel, superseding any still in flight"""
+        generation = self._generations.get(channel, 0) + 1
+        self._generations[channel] = generation
+        return generation
+    
+    def _run_query(self, channel, error_prefix, on_result, func, *args, executor=None):
+        """Run func(*args) on the worker thread and hand its result to on_result on the GUI thread"""
+        generation = self._next_generation(channel)
+        future = (executor or self._executor).submit(func, *args)
+        future.add_done_callback(
+            lambda f: wx.CallAfter(self._deliver_result, f, channel, generation, error_prefix, on_result))
+    
+    def _deliver_result(self, future, channel, generation, error_prefix, on_result):
+        """Pass a finished query's result on unless the frame is gone or it was superseded"""
+        if not self or self._generations.get(channel) != generation:
+            return
         try:
-            results = self.db_manager.search_stamps(criteria)
-            self.search_results = results
-            self.browse_panel.stamp_grid.UpdateData(results)
-            self.statusbar.SetStatusText(f"Found {len(results)} stamps")
+            result = future.result()
         except Exception as e:
-            wx.MessageBox(f"Search error: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            if channel == 'stamps':
+                # Nothing was shown for these criteria, so let the user retry them
+                self._requested_criteria = None
+            wx.MessageBox(f"{error_prefix}: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        on_result(result)
+    
+    def _filter_results(self, criteria):
+        """Filter search_results in memory, pre-screening rows by Bloom signature"""
+        query_bits = 0
+        for key in _TEXT_CRITERIA:
+            query_bits |= _bloom_for(_fold(criteria[key]))
+        
+        blooms = self._blooms
+        results = []
+        for stamp_id, stamp in self.search_results:
+            bits = blooms.get(stamp_id)
+            if bits is None:
+                bits = blooms[stamp_id] = _stamp_bloom(stamp)
+            # A row missing any query bigram can't contain the query text
+            if bits & query_bits == query_bits and _matches(stamp, criteria):
+                results.append((stamp_id, stamp))
+        return results
     
     def OnClearSearch(self, event):
         """Clear search and show all stamps"""
-        self.browse_panel.search_desc.SetValue("")
-        self.browse_panel.search_scott.SetValue("")
-        self.browse_panel.search_country.SetValue("")
+        # ChangeValue doesn't emit EVT_TEXT, so clearing doesn't schedule a search
+        self.browse_panel.search_desc.ChangeValue("")
+        self.browse_panel.search_scott.ChangeValue("")
+        self.browse_panel.search_country.ChangeValue("")
         self.browse_panel.search_used.SetValue(False)
         self.browse_panel.search_want.SetValue(False)
         self.RefreshStampList()
     
     def RefreshStampList(self):
         """Refresh the stamp list from database"""
-        try:
-            criteria = {
-                'description': '',
-                'scott_number': '',
-                'country': '',
-                'year_from': '',
-                'year_to': '',
-                'used_only': False,
-                'want_list': False
-            }
-            
-            results = self.db_manager.search_stamps(criteria)
-            self.search_results = results
-            self.browse_panel.stamp_grid.UpdateData(results)
-            self.statusbar.SetStatusText(f"Loaded {len(results)} stamps")
-            
-        except Exception as e:
-            wx.MessageBox(f"Error loading stamps: {e}", "Error", wx.OK | wx.ICON_ERROR)
+        criteria = _EMPTY_CRITERIA
+        
+        self._requested_criteria = criteria
+        if self._all_stamps_cache is not None:
+            self._next_generation('stamps')
+            self._show_results(criteria, self._all_stamps_cache, "Loaded")
+            return
+        
+        def on_loaded(results):
+            self._all_stamps_cache = results
+            self._show_results(criteria, results, "Loaded")
+        
+        # The frame paints straight away; say why the grid is still empty
+        self.statusbar.SetStatusText("Loading stamps...")
+        self._run_query('stamps', "Error loading stamps", on_loaded,
+                        self.db_manager.list_all_stamps, LIST_COLUMNS)
     
     def UpdateStatistics(self):
         """Update statistics display"""
-        try:
-            stats = self.db_manager.get_statistics()
-            
-            stats_text = f"""Collection Statistics:
+        if not self._stats_dirty and self._stats_cache:
+            self._set_stats_text(self._stats_cache)
+            return
+        
+        # Cleared before the query so a change made while it runs marks it dirty again
+        self._stats_dirty = False
+        self._run_query('stats', "Error updating statistics", self._show_statistics,
+                       self.db_manager.get_statistics)
+    
+    def _show_statistics(self, stats):
+        """Render statistics into the stats panel (GUI thread)"""
+        stats_text = f"""Collection Statistics:
 
 Total Stamps: {stats['total_stamps']:,}
 Used Stamps: {stats['used_stamps']:,}
@@ -551,16 +961,33 @@ Special Categories:
 Want List Items: {stats['want_list_items']}
 For Sale Items: {stats['for_sale_items']}
 """
-            
-            self.stats_panel.stats_text.SetValue(stats_text)
-            
-        except Exception as e:
-            wx.MessageBox(f"Error updating statistics: {e}", "Error", wx.OK | wx.ICON_ERROR)
+        
+        self._stats_cache = stats_text
+        self._set_stats_text(stats_text)
+    
+    def _set_stats_text(self, stats_text):
+        """Show stats_text, skipping the full-control repaint if it is already displayed"""
+        text_hash = hash(stats_text)
+        if text_hash == self._stats_last_hash:
+            return
+        self._stats_last_hash = text_hash
+        self.stats_panel.stats_text.SetValue(stats_text)
+    
+    def _StampIdAt(self, row):
+        """ID of the stamp listed in a grid row, or None; no database access"""
+        if 0 <= row < len(self.search_results):
+            return self.search_results[row][0]
+        return None
     
     def EditSelectedStamp(self, row):
         """Edit selected stamp (switch to edit tab)"""
-        if 0 <= row < len(self.search_results):
-            stamp_id, stamp = self.search_results[row]
+        stamp_id = self._StampIdAt(row)
+        if stamp_id is not None:
+            # Listed stamps only carry LIST_COLUMNS; the form needs every field
+            stamp = self.db_manager.get_stamp(stamp_id)
+            if stamp is None:
+                wx.MessageBox("This stamp no longer exists.", "Error", wx.OK | wx.ICON_ERROR)
+                return
             self.LoadStampToForm(stamp, stamp_id)
             self.notebook.SetSelection(1)  # Switch to edit tab
     
@@ -597,40 +1024,48 @@ For Sale Items: {stats['for_sale_items']}
         self.edit_panel.date_acquired.SetValue(stamp.date_acquired or "")
         self.edit_panel.notes.SetValue(stamp.notes or "")
         self.edit_panel.image_path.SetValue(stamp.image_path or "")
+        self._LoadPreview(stamp.image_path)
     
     def ClearForm(self):
         """Clear all form fields"""
-        self.edit_panel.current_stamp_id = None
-        
-        self.edit_panel.scott_number.SetValue("")
-        self.edit_panel.description.SetValue("")
-        self.edit_panel.country.SetValue("")
-        self.edit_panel.year.SetValue(2023)
-        self.edit_panel.denomination.SetValue("")
-        self.edit_panel.color.SetValue("")
-        self.edit_panel.location.SetValue("")
-        self.edit_panel.perforation.SetValue("")
-        
-        self.edit_panel.condition_grade.SetSelection(0)
-        self.edit_panel.gum_condition.SetSelection(0)
-        
-        self.edit_panel.qty_mint.SetValue(0)
-        self.edit_panel.qty_used.SetValue(0)
-        self.edit_panel.catalog_value_mint.SetValue("0.00")
-        self.edit_panel.catalog_value_used.SetValue("0.00")
-        
-        self.edit_panel.used.SetValue(False)
-        self.edit_panel.plate_block.SetValue(False)
-        self.edit_panel.first_day_cover.SetValue(False)
-        self.edit_panel.want_list.SetValue(False)
-        self.edit_panel.for_sale.SetValue(False)
-        
-        self.edit_panel.purchase_price.SetValue("0.00")
-        self.edit_panel.current_market_value.SetValue("0.00")
-        self.edit_panel.source.SetValue("")
-        self.edit_panel.date_acquired.SetValue("")
-        self.edit_panel.notes.SetValue("")
-        self.edit_panel.image_path.SetValue("")
+        panel = self.edit_panel
+        # Repaint the form once at the end instead of once per field
+        panel.Freeze()
+        try:
+            self.edit_panel.current_stamp_id = None
+            
+            self.edit_panel.scott_number.SetValue("")
+            self.edit_panel.description.SetValue("")
+            self.edit_panel.country.SetValue("")
+            self.edit_panel.year.SetValue(2023)
+            self.edit_panel.denomination.SetValue("")
+            self.edit_panel.color.SetValue("")
+            self.edit_panel.location.SetValue("")
+            self.edit_panel.perforation.SetValue("")
+            
+            self.edit_panel.condition_grade.SetSelection(0)
+            self.edit_panel.gum_condition.SetSelection(0)
+            
+            self.edit_panel.qty_mint.SetValue(0)
+            self.edit_panel.qty_used.SetValue(0)
+            self.edit_panel.catalog_value_mint.SetValue("0.00")
+            self.edit_panel.catalog_value_used.SetValue("0.00")
+            
+            self.edit_panel.used.SetValue(False)
+            self.edit_panel.plate_block.SetValue(False)
+            self.edit_panel.first_day_cover.SetValue(False)
+            self.edit_panel.want_list.SetValue(False)
+            self.edit_panel.for_sale.SetValue(False)
+            
+            self.edit_panel.purchase_price.SetValue("0.00")
+            self.edit_panel.current_market_value.SetValue("0.00")
+            self.edit_panel.source.SetValue("")
+            self.edit_panel.date_acquired.SetValue("")
+            self.edit_panel.notes.SetValue("")
+            self.edit_panel.image_path.SetValue("")
+            self._LoadPreview(None)
+        finally:
+            panel.Thaw()
     
     def ValidateForm(self):
         """Validate form fields"""
@@ -643,12 +1078,13 @@ For Sale Items: {stats['for_sale_items']}
             return False
         
         # Validate numeric fields
-        try:
-            Decimal(self.edit_panel.catalog_value_used.GetValue())
-            Decimal(self.edit_panel.catalog_value_mint.GetValue())
-            Decimal(self.edit_panel.purchase_price.GetValue())
-            Decimal(self.edit_panel.current_market_value.GetValue())
-        except InvalidOperation:
+        price_fields = (
+            self.edit_panel.catalog_value_used,
+            self.edit_panel.catalog_value_mint,
+            self.edit_panel.purchase_price,
+            self.edit_panel.current_market_value,
+        )
+        if not all(_MONEY_RE.match(field.GetValue().strip()) for field in price_fields):
             wx.MessageBox("Invalid numeric value in price fields!", "Validation Error", wx.OK | wx.ICON_ERROR)
             return False
         
@@ -673,10 +1109,10 @@ For Sale Items: {stats['for_sale_items']}
             notes=self.edit_panel.notes.GetValue() or None,
             qty_mint=self.edit_panel.qty_mint.GetValue(),
             qty_used=self.edit_panel.qty_used.GetValue(),
-            catalog_value_mint=Decimal(self.edit_panel.catalog_value_mint.GetValue()),
-            catalog_value_used=Decimal(self.edit_panel.catalog_value_used.GetValue()),
-            purchase_price=Decimal(self.edit_panel.purchase_price.GetValue()),
-            current_market_value=Decimal(self.edit_panel.current_market_value.GetValue()),
+            catalog_value_mint=_parse_money(self.edit_panel.catalog_value_mint.GetValue()),
+            catalog_value_used=_parse_money(self.edit_panel.catalog_value_used.GetValue()),
+            purchase_price=_parse_money(self.edit_panel.purchase_price.GetValue()),
+            current_market_value=_parse_money(self.edit_panel.current_market_value.GetValue()),
             want_list=self.edit_panel.want_list.GetValue(),
             for_sale=self.edit_panel.for_sale.GetValue(),
             date_acquired=self.edit_panel.date_acquired.GetValue() or None,
@@ -684,6 +1120,37 @@ For Sale Items: {stats['for_sale_items']}
             image_path=self.edit_panel.image_path.GetValue() or None
         )
     
+    def _invalidate_caches(self, stamp_ids=()):
+        """Drop cached data made stale by adding, changing or deleting stamps"""
+        for stamp_id in stamp_ids:
+            self._row_cache.pop(stamp_id, None)
+            self._blooms.pop(stamp_id, None)
+        self._all_stamps_cache = None
+        self._stats_dirty = True
+    
+    def _RemoveListedStamps(self, stamp_ids):
+        """Take deleted stamps out of the listed results without reloading the list"""
+        self.search_results = [item for item in self.search_results if item[0] not in stamp_ids]
+        grid = self.browse_panel.stamp_grid
+        grid.ClearSelection()
+        grid.table.RemoveStamps(stamp_ids)
+    
+    def _ScheduleRefresh(self):
+        """Reload the stamp list shortly, coalescing requests made in quick succession"""
+        if self._refresh_timer is not None and self._refresh_timer.IsRunning():
+            self._refresh_timer.Restart(self.REFRESH_DELAY_MS)
+        else:
+            self._refresh_timer = wx.CallLater(self.REFRESH_DELAY_MS, self.RefreshStampList)
+    
+    def _Notify(self, message):
+        """Report a finished action in the status bar and a transient toast, without a modal box"""
+        self.statusbar.SetStatusText(message)
+        # The notification must outlive this call to stay on screen
+        if self._notification is None:
+            self._notification = wx.adv.NotificationMessage(self.GetTitle(), parent=self)
+        self._notification.SetMessage(message)
+        self._notification.Show(timeout=2)
+    
     # Button event handlers
     def OnAddStamp(self, event):
         """Add new stamp"""
@@ -691,8 +1158,9 @@ For Sale Items: {stats['for_sale_items']}
             try:
                 stamp = self.CreateStampFromForm()
                 self.db_manager.add_stamp(stamp)
+                self._invalidate_caches()
                 self.ClearForm()
-                self.RefreshStampList()
+                self._ScheduleRefresh()
                 wx.MessageBox("Stamp added successfully!", "Success", wx.OK | wx.ICON_INFORMATION)
                 self.statusbar.SetStatusText("Stamp added successfully")
             except Exception as e:
@@ -708,8 +1176,9 @@ For Sale Items: {stats['for_sale_items']}
             try:
                 stamp = self.CreateStampFromForm()
                 self.db_manager.update_stamp(self.edit_panel.current_stamp_id, stamp)
+                self._invalidate_caches((self.edit_panel.current_stamp_id,))
                 self.ClearForm()
-                self.RefreshStampList()
+                self._ScheduleRefresh()
                 wx.MessageBox("Stamp updated successfully!", "Success", wx.OK | wx.ICON_INFORMATION)
                 self.statusbar.SetStatusText("Stamp updated successfully")
             except Exception as e:
@@ -721,20 +1190,20 @@ For Sale Items: {stats['for_sale_items']}
             wx.MessageBox("No stamp selected!", "Error", wx.OK | wx.ICON_ERROR)
             return
         
-        dlg = wx.MessageDialog(self, "Are you sure you want to delete this stamp?", 
-                              "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION)
-        
-        if dlg.ShowModal() == wx.ID_YES:
-            try:
-                self.db_manager.delete_stamp(self.edit_panel.current_stamp_id)
-                self.ClearForm()
-                self.RefreshStampList()
-                wx.MessageBox("Stamp deleted successfully!", "Success", wx.OK | wx.ICON_INFORMATION)
-                self.statusbar.SetStatusText("Stamp deleted successfully")
-            except Exception as e:
-                wx.MessageBox(f"Error deleting stamp: {e}", "Error", wx.OK | wx.ICON_ERROR)
+        with wx.MessageDialog(self, "Are you sure you want to delete this stamp?",
+                              "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION) as dlg:
+            if dlg.ShowModal() != wx.ID_YES:
+                return
         
-        dlg.Destroy()
+        try:
+            stamp_ids = {self.edit_panel.current_stamp_id}
+            self.db_manager.delete_stamp(self.edit_panel.current_stamp_id)
+            self._invalidate_caches(stamp_ids)
+            self.ClearForm()
+            self._RemoveListedStamps(stamp_ids)
+            self._Notify("Stamp deleted successfully")
+        except Exception as e:
+            wx.MessageBox(f"Error deleting stamp: {e}", "Error", wx.OK | wx.ICON_ERROR)
     
     def OnClearForm(self, event):
         """Clear form fields"""
@@ -742,13 +1211,26 @@ For Sale Items: {stats['for_sale_items']}
     
     def OnBrowseImage(self, event):
         """Browse for image file"""
-        wildcard = "Image files (*.jpg;*.jpeg;*.png;*.gif)|*.jpg;*.jpeg;*.png;*.gif"
-        dlg = wx.FileDialog(self, "Choose image file", wildcard=wildcard, style=wx.FD_OPEN)
+        # One dialog is kept for the frame's lifetime and reopened where it was last used
+        if self._image_dlg is None:
+            self._image_dlg = wx.FileDialog(self, "Choose image file", wildcard=IMAGE_WILDCARD, style=wx.FD_OPEN)
+        dlg = self._image_dlg
+        dlg.SetDirectory(self._last_image_dir or wx.StandardPaths.Get().GetDocumentsDir())
         
         if dlg.ShowModal() == wx.ID_OK:
-            self.edit_panel.image_path.SetValue(dlg.GetPath())
-        
-        dlg.Destroy()
+            path = dlg.GetPath()
+            self.edit_panel.image_path.SetValue(path)
+            self._last_image_dir = os.path.dirname(path)
+            self._LoadPreview(path)
+    
+    def _LoadPreview(self, path):
+        """Decode the image at path in the background and show it when ready"""
+        if not path or os.path.splitext(path)[1].lower() not in IMAGE_EXTS:
+            self._next_generation('image')
+            self.edit_panel.SetPreview(None)
+            return
+        self._run_query('image', "Image error", self.edit_panel.SetPreview,
+                        _load_thumbnail, path, EditPanel.PREVIEW_SIZE, executor=self._image_pool)
     
     # Menu event handlers
     def OnMenuAdd(self, event):
@@ -765,20 +1247,92 @@ For Sale Items: {stats['for_sale_items']}
             wx.MessageBox("Please select a stamp to edit", "No Selection", wx.OK | wx.ICON_INFORMATION)
     
     def OnMenuDelete(self, event):
-        """Handle Delete menu item"""
-        selected_row = self.browse_panel.stamp_grid.GetGridCursorRow()
-        if selected_row >= 0:
-            self.EditSelectedStamp(selected_row)
-            self.OnDeleteStamp(event)
-        else:
+        """Handle Delete menu item: delete every selected stamp at once"""
+        grid = self.browse_panel.stamp_grid
+        rows = grid.GetSelectedRows() or [grid.GetGridCursorRow()]
+        stamp_ids = [stamp_id for stamp_id in map(self._StampIdAt, rows) if stamp_id is not None]
+        if not stamp_ids:
             wx.MessageBox("Please select a stamp to delete", "No Selection", wx.OK | wx.ICON_INFORMATION)
+            return
+        
+        count = len(stamp_ids)
+        message = ("Are you sure you want to delete this stamp?" if count == 1 else
+                   f"Are you sure you want to delete these {count} stamps?")
+        with wx.MessageDialog(self, message, "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION) as dlg:
+            if dlg.ShowModal() != wx.ID_YES:
+                return
+        
+        try:
+            self.db_manager.delete_stamps(stamp_ids)
+            stamp_ids = set(stamp_ids)
+            self._invalidate_caches(stamp_ids)
+            # Only clear the form if it exists and shows a deleted stamp
+            if self._edit_panel is not None and self._edit_panel.current_stamp_id in stamp_ids:
+                self.ClearForm()
+            self._RemoveListedStamps(stamp_ids)
+            self._Notify(f"Deleted {count} stamp(s)")
+        except Exception as e:
+            wx.MessageBox(f"Error deleting stamps: {e}", "Error", wx.OK | wx.ICON_ERROR)
+    
+    def OnImportCSV(self, event):
+        """Add the stamps from a CSV file"""
+        with wx.FileDialog(self, "Import stamps from CSV", wildcard=CSV_WILDCARD,
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            path = dlg.GetPath()
+        
+        try:
+            with wx.BusyCursor():
+                count = self.db_manager.import_csv(path)
+        except Exception as e:
+            wx.MessageBox(f"Error importing stamps: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self._invalidate_caches()
+        self._ScheduleRefresh()
+        self._Notify(f"Imported {count} stamp(s)")
+    
+    def OnExportCSV(self, event):
+        """Write the whole collection to a CSV file"""
+        with wx.FileDialog(self, "Export stamps to CSV", defaultFile="stamps.csv", wildcard=CSV_WILDCARD,
+                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            path = dlg.GetPath()
+        
+        try:
+            with wx.BusyCursor():
+                count = self.db_manager.export_csv(path)
+        except Exception as e:
+            wx.MessageBox(f"Error exporting stamps: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        self._Notify(f"Exported {count} stamp(s)")
     
     def OnExit(self, event):
         """Handle exit menu"""
         self.Close()
     
+    def OnClose(self, event):
+        """Close the database before the frame is destroyed"""
+        # No reload may start once closing begins
+        if self._refresh_timer is not None:
+            self._refresh_timer.Stop()
+        # Let the worker finish its current query before the connection goes away
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._image_pool.shutdown(wait=False, cancel_futures=True)
+        self.db_manager.close()
+        if self._image_dlg is not None:
+            self._image_dlg.Destroy()
+        event.Skip()
+    
     def OnAbout(self, event):
         """Show about dialog"""
+        if self._about_info is None:
+            self._about_info = self._BuildAboutInfo()
+        wx.adv.AboutBox(self._about_info)
+    
+    def _BuildAboutInfo(self):
+        """Describe the application for the about dialog"""
         info = wx.adv.AboutDialogInfo()
         info.SetName("Professional Stamp Collection Manager")
         info.SetVersion("2.0")
@@ -792,8 +1346,7 @@ For Sale Items: {stats['for_sale_items']}
         info.SetCopyright("(C) 2024")
         info.AddDeveloper("Stamp Collection Manager Team")
         info.SetWebSite("https://github.com/your-repo/stamp-manager")
-        
-        wx.adv.AboutBox(info)
+        return info
 
 
 class StampApp(wx.App):